@@ -12,15 +12,34 @@ Users deserve to see exactly how Scribe helps them.
 """
 
 import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 import json
 
+import numpy as np
+
 
 logger = logging.getLogger(__name__)
 
+# Rows of the per-transcription column table: one contiguous float64 array
+# per field, so session summaries reduce each field in a single pass
+(
+    _COL_TIMESTAMP,
+    _COL_WORDS,
+    _COL_CHARACTERS,
+    _COL_AUDIO,
+    _COL_TRANSCRIPTION,
+    _COL_AI_ENHANCEMENT,
+    _COL_CORRECTIONS,
+    _COL_TIME_SAVED,
+    _COL_CONFIDENCE,  # NaN when unknown
+) = range(9)
+_NUM_COLUMNS = 9
+_MIN_GROWTH = 1024  # rows added at least per reallocation
+
 
 @dataclass
 class TranscriptionMetrics:
@@ -125,8 +144,26 @@ class ValueCalculator:
         self._commands: List[CommandMetrics] = []
         self._session_start = datetime.now()
 
+        # Numeric fields of _transcriptions, column-major; first _rows used
+        self._columns = np.empty((_NUM_COLUMNS, 0))
+        self._rows = 0
+        self._version = 0
+        # Guards the record tables: summaries may be computed on pool threads
+        # (HomePage) while the GUI thread records new events
+        self._lock = threading.Lock()
+
         logger.info(f"ValueCalculator initialized. Data dir: {self.data_dir}")
 
+    @property
+    def version(self) -> int:
+        """
+        Counter bumped by every record_* call.
+
+        Views that derive data from the session (e.g. InsightsPage) can
+        compare it against the value they last rendered to skip rebuilding.
+        """
+        return self._version
+
     # ==================== Recording Methods ====================
 
     def record_transcription(
@@ -174,9 +211,36 @@ class ValueCalculator:
             text=text,
         )
 
-        self._transcriptions.append(metrics)
+        with self._lock:
+            self._transcriptions.append(metrics)
+            self._append_row(metrics)
+            self._version += 1
         logger.debug(f"Recorded transcription: {word_count} words in {transcription_time:.2f}s")
         return metrics
+
+    def _append_row(self, metrics: TranscriptionMetrics):
+        """Append a transcription's numeric fields to the column table."""
+        capacity = self._columns.shape[1]
+        if self._rows == capacity:
+            # Grow geometrically so appends stay amortized O(1)
+            grown = np.empty((_NUM_COLUMNS, capacity + max(_MIN_GROWTH, capacity)))
+            grown[:, :self._rows] = self._columns[:, :self._rows]
+            self._columns = grown
+
+        # Time saved is fixed once recorded, so it's computed here rather
+        # than per event in every summary
+        self._columns[:, self._rows] = (
+            metrics.timestamp.timestamp(),
+            metrics.word_count,
+            metrics.character_count,
+            metrics.audio_duration,
+            metrics.transcription_time,
+            metrics.ai_enhancement_time,
+            metrics.corrections_made,
+            self.calculate_time_saved(metrics.word_count, metrics.audio_duration, metrics.was_command),
+            np.nan if metrics.confidence is None else metrics.confidence,
+        )
+        self._rows += 1
 
     def record_command(
         self,
@@ -205,7 +269,9 @@ class ValueCalculator:
             error_message=error_message
         )
 
-        self._commands.append(metrics)
+        with self._lock:
+            self._commands.append(metrics)
+            self._version += 1
         logger.debug(f"Recorded command: {command_pattern} ({plugin}) - {'✅' if success else '❌'})")
 
     # ==================== Value Calculation Methods ====================
@@ -279,18 +345,18 @@ class ValueCalculator:
         Returns:
             Accuracy score from 0.0 to 1.0
         """
-        if not transcriptions:
-            return 1.0
-
-        total_words = sum(t.word_count for t in transcriptions)
-        total_corrections = sum(t.corrections_made for t in transcriptions)
+        return self._accuracy(
+            sum(t.word_count for t in transcriptions),
+            sum(t.corrections_made for t in transcriptions),
+        )
 
+    @staticmethod
+    def _accuracy(total_words: int, total_corrections: int) -> float:
+        """Accuracy = 1 - (corrections / words), clamped to [0, 1]; 1.0 with no words."""
         if total_words == 0:
             return 1.0
-
-        # Accuracy = 1 - (corrections / words)
         accuracy = 1.0 - (total_corrections / total_words)
-        return max(0.0, min(1.0, accuracy))  # Clamp to [0, 1]
+        return max(0.0, min(1.0, accuracy))
 
     # ==================== Summary Methods ====================
 
@@ -307,49 +373,47 @@ class ValueCalculator:
         start_time = since or self._session_start
         end_time = datetime.now()
 
-        # Filter metrics by time range
-        transcriptions = [t for t in self._transcriptions if t.timestamp >= start_time]
-        commands = [c for c in self._commands if c.timestamp >= start_time]
+        # Filter metrics by time range. Everything recorded so far is after
+        # the session start, so only an explicit `since` needs a mask
+        with self._lock:
+            # Rows past _rows are written after this, so the slice is stable
+            columns = self._columns[:, :self._rows]
+            commands = list(self._commands)
+        if since is not None:
+            columns = columns[:, columns[_COL_TIMESTAMP] >= start_time.timestamp()]
+            commands = [c for c in commands if c.timestamp >= start_time]
 
-        # Calculate totals
-        total_words = sum(t.word_count for t in transcriptions)
-        total_chars = sum(t.character_count for t in transcriptions)
-        total_audio = sum(t.audio_duration for t in transcriptions)
-        total_transcription_time = sum(t.transcription_time for t in transcriptions)
-        total_ai_time = sum(t.ai_enhancement_time for t in transcriptions)
+        # Calculate totals: one reduction over every column
+        totals = columns.sum(axis=1)
+        total_words = int(totals[_COL_WORDS])
 
         # Command stats
         successful_cmds = sum(1 for c in commands if c.success)
-        failed_cmds = sum(1 for c in commands if not c.success)
-
-        # Calculate time saved
-        time_saved = sum(
-            self.calculate_time_saved(t.word_count, t.audio_duration, t.was_command)
-            for t in transcriptions
-        )
+        failed_cmds = len(commands) - successful_cmds
 
         # Create summary
-        avg_confidence = 0.0
-        conf_values = [t.confidence for t in transcriptions if t.confidence is not None]
-        if conf_values:
-            avg_confidence = sum(conf_values) / len(conf_values)
-
-        summary = SessionSummary(
-            start_time=start_time,
-            end_time=end_time,
-            total_transcriptions=len(transcriptions),
+        avg_confidence = 0.0
+        confidences = columns[_COL_CONFIDENCE]
+        known = confidences[~np.isnan(confidences)]
+        if known.size:
+            avg_confidence = float(known.mean())
+
+        summary = SessionSummary(
+            start_time=start_time,
+            end_time=end_time,
+            total_transcriptions=columns.shape[1],
             total_words=total_words,
-            total_characters=total_chars,
-            total_audio_duration=total_audio,
-            total_transcription_time=total_transcription_time,
-            total_ai_enhancement_time=total_ai_time,
-            total_commands=len(commands),
-            successful_commands=successful_cmds,
-            failed_commands=failed_cmds,
-            time_saved_vs_typing=time_saved,
-            accuracy_score=self.calculate_accuracy_score(transcriptions),
-            average_confidence=avg_confidence,
-        )
+            total_characters=int(totals[_COL_CHARACTERS]),
+            total_audio_duration=float(totals[_COL_AUDIO]),
+            total_transcription_time=float(totals[_COL_TRANSCRIPTION]),
+            total_ai_enhancement_time=float(totals[_COL_AI_ENHANCEMENT]),
+            total_commands=len(commands),
+            successful_commands=successful_cmds,
+            failed_commands=failed_cmds,
+            time_saved_vs_typing=float(totals[_COL_TIME_SAVED]),
+            accuracy_score=self._accuracy(total_words, int(totals[_COL_CORRECTIONS])),
+            average_confidence=avg_confidence,
+        )
 
         # Calculate productivity multiplier
         summary.productivity_multiplier = self.calculate_productivity_multiplier(summary)
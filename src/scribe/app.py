@@ -5,11 +5,14 @@ Clean break from WhisperWriter. Built for modern approaches and tech.
 Phoenix rising with plugin-first architecture.
 """
 
+import os
 import sys
 import time
 import logging
 import re
-from typing import Dict, Optional, Any, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Any, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -20,6 +23,16 @@ except ImportError:  # pragma: no cover - optional dependency
     win32gui = None
     win32con = None
 
+try:
+    import re2  # type: ignore  # google-re2, opt-in via SCRIBE_USE_RE2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
+
+try:
+    import pcre2  # type: ignore  # PCRE2 with JIT, opt-in via SCRIBE_USE_PCRE_JIT
+except ImportError:  # pragma: no cover - optional dependency
+    pcre2 = None
+
 from PyQt5.QtCore import QObject, QTimer, QThread, Qt, pyqtSignal as Signal, qInstallMessageHandler, QtMsgType
 from PyQt5.QtWidgets import QApplication, QDialog
 from PyQt5.QtGui import QIcon
@@ -40,6 +53,215 @@ from scribe.workers import TranscriptionWorker
 
 logger = logging.getLogger(__name__)
 
+_WORD_CHAR = re.compile(r"\w")
+
+# Shared, read-only parameters for commands without placeholders
+_NO_PARAMS: Mapping[str, str] = MappingProxyType({})
+
+
+def _command_pattern_regex(pattern: str) -> str:
+    """
+    Translate a normalized command pattern into a regex.
+    
+    Args:
+        pattern: Stripped, lower-cased pattern like "switch to {app}"
+        
+    Returns:
+        Regex source with a named group per {placeholder}
+    """
+    parts = pattern.split()
+    last = len(parts) - 1
+    tokens = []
+    
+    for i, part in enumerate(parts):
+        if part.startswith("{") and part.endswith("}"):
+            # Extract placeholder name
+            name = part[1:-1]
+            
+            # Check if this is the last token - if so, match everything remaining
+            is_last = i == last
+            
+            if is_last:
+                # Last placeholder: every remaining word. Whitespace-delimited
+                # tokens keep backtracking (for the trailing \b, which drops
+                # sentence punctuation) confined to the final word.
+                tokens.append(rf"(?P<{name}>\S+(?:\s+\S+)*)")
+            else:
+                # Middle placeholder: non-greedy match for one or more words
+                tokens.append(rf"(?P<{name}>\S+)")
+        else:
+            # Literal text - escape special regex characters
+            tokens.append(re.escape(part))
+    
+    # Join with flexible whitespace matching
+    return r"\b" + r"\s+".join(tokens) + r"\b"
+
+
+@lru_cache(maxsize=1024)
+def _pattern_literals(pattern: str) -> Tuple[str, ...]:
+    """Literal (non-placeholder) words of a normalized command pattern, interned."""
+    return tuple(
+        sys.intern(part) for part in pattern.split()
+        if not (part.startswith("{") and part.endswith("}"))
+    )
+
+
+@lru_cache(maxsize=1024)
+def _pattern_has_params(pattern: str) -> bool:
+    """Whether a normalized command pattern has any {placeholder}."""
+    return len(_pattern_literals(pattern)) != len(pattern.split())
+
+
+@lru_cache(maxsize=1024)
+def _exact_command_words(pattern: str) -> Optional[Tuple[str, ...]]:
+    """
+    Words an utterance must consist of to match a pattern without a regex.
+    
+    An utterance made of exactly the words of a placeholder-free pattern
+    always matches it, so dispatch can compare interned word tuples
+    instead of searching. Patterns with placeholders, or that begin or
+    end on a non-word character (where the regex's \\b would not hold at
+    the ends of the text), return None and always go through the regex.
+    
+    Args:
+        pattern: Stripped, lower-cased pattern like "list windows"
+        
+    Returns:
+        Tuple of interned words, or None
+    """
+    literals = _pattern_literals(pattern)
+    if not literals or len(literals) != len(pattern.split()):
+        return None
+    if not (_WORD_CHAR.match(pattern[0]) and _WORD_CHAR.match(pattern[-1])):
+        return None
+    return literals
+
+
+def _env_flag(name: str) -> bool:
+    """Whether an opt-in environment flag is set to 1/true/yes."""
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=None)
+def _check_re2_enabled() -> bool:
+    """Whether google-re2 is requested via SCRIBE_USE_RE2 and installed."""
+    return re2 is not None and _env_flag("SCRIBE_USE_RE2")
+
+
+@lru_cache(maxsize=None)
+def _check_jit_available() -> bool:
+    """Whether PCRE2-JIT is requested via SCRIBE_USE_PCRE_JIT and works on this machine."""
+    if pcre2 is None or not _env_flag("SCRIBE_USE_PCRE_JIT"):
+        return False
+    try:
+        return bool(pcre2.compile(r"\bprobe\b", jit=True).jit)
+    except Exception as e:
+        logger.info(f"PCRE2 JIT unavailable, using re: {e}")
+        return False
+
+
+@lru_cache(maxsize=1024)
+def _compile_command_pattern(pattern: str, ascii_text: bool = False):
+    """
+    Compile a normalized command pattern, cached per pattern.
+    
+    The same plugin patterns are tried against every utterance. Engines,
+    in order of preference:
+    - PCRE2-JIT (native code) when SCRIBE_USE_PCRE_JIT is set and the
+      pcre2 package is installed
+    - google-re2 when SCRIBE_USE_RE2 is set, for ASCII text only: RE2's \b
+      is ASCII-only, so other text stays on re
+    - re
+    
+    Both alternatives are opt-in: on typical few-word utterances their
+    per-call binding overhead makes them several times slower than re.
+    They bound worst-case matching time rather than speed up the
+    common case.
+    
+    Args:
+        pattern: Stripped, lower-cased pattern like "switch to {app}"
+        ascii_text: Whether the text to be searched is pure ASCII
+        
+    Returns:
+        Compiled pattern object exposing search()
+    """
+    regex = _command_pattern_regex(pattern)
+    if _check_jit_available():
+        try:
+            return pcre2.compile(regex, jit=True)
+        except pcre2.error as e:
+            logger.debug(f"PCRE2 cannot compile '{pattern}', falling back: {e}")
+    if ascii_text and _check_re2_enabled():
+        try:
+            return re2.compile(regex)
+        except re2.error as e:
+            logger.debug(f"RE2 cannot compile '{pattern}', using re: {e}")
+    return re.compile(regex)
+
+
+def _first_matching_command(text: str, rows):
+    """
+    Find the first dispatch row whose pattern matches an utterance.
+    
+    This loop runs for every candidate pattern on every utterance, so the
+    per-pattern work is inlined and the ASCII check and helper lookups are
+    done once up front.
+    
+    Args:
+        text: Utterance, already stripped and lower-cased
+        rows: Iterable of (pattern, key, command) rows, tried in order, where
+            key is the pattern stripped and lower-cased (normalized once,
+            when PluginRegistry builds its dispatch table)
+        
+    Returns:
+        (pattern, command, parameters) for the first match, or None.
+        Placeholder-free matches share the read-only _NO_PARAMS mapping
+    """
+    ascii_text = text.isascii()
+    words = tuple(map(sys.intern, text.split()))
+    exact_of = _exact_command_words
+    has_params = _pattern_has_params
+    literals_of = _pattern_literals
+    compile_pattern = _compile_command_pattern
+    
+    for pattern, key, command in rows:
+        if not key:
+            continue
+        
+        # The utterance is exactly this placeholder-free command: interned
+        # tuples compare by identity word for word, no regex needed
+        if exact_of(key) == words:
+            return pattern, command, _NO_PARAMS
+        
+        # Every literal word has to appear in the text, so most patterns
+        # (all of them, for placeholder-free commands that don't match) are
+        # rejected with substring checks before any regex runs
+        if not all(word in text for word in literals_of(key)):
+            continue
+        
+        match = compile_pattern(key, ascii_text).search(text)
+        if match:
+            # Named groups are the parameters. Every group starts and ends
+            # on \S, so the values need no stripping
+            return pattern, command, match.groupdict() if has_params(key) else _NO_PARAMS
+    
+    return None
+
+
+def _match_command_pattern(text: str, pattern: str) -> Tuple[bool, Mapping[str, str]]:
+    """
+    Match an utterance against a single command pattern.
+    
+    Args:
+        text: Utterance, already stripped and lower-cased
+        pattern: Command pattern like "switch to {app}"
+        
+    Returns:
+        Tuple of (matched: bool, parameters: mapping)
+    """
+    hit = _first_matching_command(text, ((pattern, pattern.strip().lower(), None),))
+    return (True, hit[2]) if hit else (False, _NO_PARAMS)
+
 
 class ScribeApp(QObject):
     """
@@ -1257,54 +1479,51 @@ class ScribeApp(QObject):
 
         text_lower = text.lower().strip()
 
-        # Try to find matching command
-        for pattern, commands in self.plugin_registry._commands.items():
-            # Pattern matching with parameter extraction
-            matched, params = self._pattern_matches(text_lower, pattern)
-            
-            if matched:
-                command = commands[0]  # Use first matching command
-                plugin_name = command.plugin.name
+        # Try to find matching command (pattern matching with parameter extraction)
+        hit = _first_matching_command(text_lower, self.plugin_registry.candidate_commands(text_lower))
+        if hit is None:
+            return False, None
+        
+        pattern, command, params = hit
+        plugin_name = command.plugin.name
 
-                try:
-                    import time
-                    start_time = time.time()
-
-                    # Execute command with extracted parameters
-                    logger.info(f"Executing command: {pattern} via {plugin_name} with params: {params}")
-                    
-                    # Call handler with extracted parameters as keyword arguments
-                    result = command.handler(**params)
-                    execution_time = time.time() - start_time
-
-                    # Track analytics
-                    self.value_calculator.record_command(
-                        command_pattern=pattern,
-                        plugin=plugin_name,
-                        execution_time=execution_time,
-                        success=True
-                    )
+        try:
+            import time
+            start_time = time.time()
 
-                    # Emit to UI
-                    self.plugin_command_executed.emit(plugin_name, str(result))
+            # Execute command with extracted parameters
+            logger.info(f"Executing command: {pattern} via {plugin_name} with params: {dict(params)}")
+            
+            # Call handler with extracted parameters as keyword arguments
+            result = command.execute(**params)
+            execution_time = time.time() - start_time
+
+            # Track analytics
+            self.value_calculator.record_command(
+                command_pattern=pattern,
+                plugin=plugin_name,
+                execution_time=execution_time,
+                success=True
+            )
 
-                    logger.info(f"Command executed successfully: {result}")
-                    return True, plugin_name
+            # Emit to UI
+            self.plugin_command_executed.emit(plugin_name, str(result))
 
-                except Exception as e:
-                    logger.error(f"Command execution failed: {e}")
-                    self.value_calculator.record_command(
-                        command_pattern=pattern,
-                        plugin=plugin_name,
-                        execution_time=0,
-                        success=False,
-                        error_message=str(e)
-                    )
-                    return False, plugin_name
+            logger.info(f"Command executed successfully: {result}")
+            return True, plugin_name
 
-        return False, None
+        except Exception as e:
+            logger.error(f"Command execution failed: {e}")
+            self.value_calculator.record_command(
+                command_pattern=pattern,
+                plugin=plugin_name,
+                execution_time=0,
+                success=False,
+                error_message=str(e)
+            )
+            return False, plugin_name
 
-    def _pattern_matches(self, text: str, pattern: str) -> Tuple[bool, Dict[str, str]]:
+    def _pattern_matches(self, text: str, pattern: str) -> Tuple[bool, Mapping[str, str]]:
         """
         Template-based matching with {placeholder} variable extraction.
         
@@ -1313,7 +1532,7 @@ class ScribeApp(QObject):
             pattern: Command pattern like "switch to {app}" or "open {file}"
             
         Returns:
-            Tuple of (matched: bool, parameters: dict)
+            Tuple of (matched: bool, parameters: mapping)
             
         Examples:
             >>> _pattern_matches("switch to chrome", "switch to {app}")
@@ -1325,49 +1544,7 @@ class ScribeApp(QObject):
             >>> _pattern_matches("open file.txt in editor", "open {file} in {app}")
             (True, {"file": "file.txt", "app": "editor"})
         """
-        pattern = pattern.strip().lower()
-        text = text.strip().lower()
-        
-        if not pattern:
-            return False, {}
-
-        # Build regex with named capture groups for placeholders
-        tokens = []
-        placeholder_names = []
-        
-        for i, part in enumerate(pattern.split()):
-            if part.startswith("{") and part.endswith("}"):
-                # Extract placeholder name
-                name = part[1:-1]
-                placeholder_names.append(name)
-                
-                # Check if this is the last token - if so, match everything remaining
-                is_last = (i == len(pattern.split()) - 1)
-                
-                if is_last:
-                    # Last placeholder: greedy match to end of string
-                    tokens.append(rf"(?P<{name}>.+)")
-                else:
-                    # Middle placeholder: non-greedy match for one or more words
-                    tokens.append(rf"(?P<{name}>\S+)")
-            else:
-                # Literal text - escape special regex characters
-                tokens.append(re.escape(part))
-        
-        # Join with flexible whitespace matching
-        regex = r"\b" + r"\s+".join(tokens) + r"\b"
-        
-        # Try to match
-        match = re.search(regex, text)
-        
-        if match:
-            # Extract all named groups (parameters)
-            params = match.groupdict()
-            # Clean up parameters - strip whitespace
-            params = {k: v.strip() for k, v in params.items()}
-            return True, params
-        else:
-            return False, {}
+        return _match_command_pattern(text.strip().lower(), pattern)
 
     # ==================== UI Actions ====================
 
@@ -11,7 +11,8 @@ from .models import (
     AIFormattingConfig,
     PostProcessingConfig,
     PluginConfig,
-    UIConfig
+    UIConfig,
+    default_values
 )
 
 __all__ = [
@@ -23,5 +24,6 @@ __all__ = [
     "AIFormattingConfig",
     "PostProcessingConfig",
     "PluginConfig",
-    "UIConfig"
+    "UIConfig",
+    "default_values"
 ]
@@ -4,12 +4,19 @@ Modern configuration manager for Scribe with YAML and Pydantic support.
 
 import os
 import yaml
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Any
+from typing import Iterator, Optional, Any
 from PySide6.QtCore import QObject, Signal
 
 from .models import AppConfig
 
+# libyaml's C loader/dumper when PyYAML was built with it, else pure Python
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_UNSET = object()
+
 
 class ConfigManager(QObject):
     """
@@ -44,6 +51,12 @@ class ConfigManager(QObject):
         
         self._config: Optional[AppConfig] = None
         self._config_file: Optional[Path] = None
+        # model_dump() of the config as of the last load or save
+        self._saved_data: Optional[dict] = None
+        
+        # set() calls inside batch(): nesting depth and sections changed so far
+        self._batch_depth = 0
+        self._batched_sections: dict[str, None] = {}
     
     @property
     def config(self) -> AppConfig:
@@ -52,6 +65,11 @@ class ConfigManager(QObject):
             self.load_or_create_default()
         return self._config
     
+    @property
+    def config_file(self) -> Optional[Path]:
+        """Path of the config file last loaded or saved."""
+        return self._config_file
+    
     def config_exists(self, profile: str = "default") -> bool:
         """Check if configuration file exists for given profile."""
         config_file = self.config_dir / f"{profile}.yaml"
@@ -84,11 +102,12 @@ class ConfigManager(QObject):
             raise FileNotFoundError(f"Config file not found: {config_file}")
         
         with open(config_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         
         # Validate and load with Pydantic
         self._config = AppConfig(**data)
         self._config_file = config_file
+        self._saved_data = self._config.model_dump(mode='python', exclude_none=False)
         
         self.config_loaded.emit()
         return self._config
@@ -97,6 +116,10 @@ class ConfigManager(QObject):
         """
         Save current configuration to YAML file.
         
+        Skipped when the config serializes the same as it did at the last
+        load or save, so changes made directly on the model are still
+        written.
+        
         Args:
             profile: Profile name to save to. If None, uses current profile.
             
@@ -113,12 +136,19 @@ class ConfigManager(QObject):
         
         # Convert Pydantic model to dict
         data = self._config.model_dump(mode='python', exclude_none=False)
+        if data == self._saved_data and config_file == self._config_file and config_file.exists():
+            return config_file
         
-        # Write to YAML
-        with open(config_file, 'w', encoding='utf-8') as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False, indent=2)
+        # Write to YAML. With an encoding the dumper emits bytes straight
+        # into the file instead of going through a text-mode wrapper
+        with open(config_file, 'wb') as f:
+            yaml.dump(
+                data, f, Dumper=_YamlDumper, encoding='utf-8', allow_unicode=True,
+                default_flow_style=False, sort_keys=False, indent=2,
+            )
         
         self._config_file = config_file
+        self._saved_data = data
         self.config_saved.emit()
         
         return config_file
@@ -135,6 +165,7 @@ class ConfigManager(QObject):
         """
         self._config = AppConfig(profile_name=profile)
         self._config_file = self.config_dir / f"{profile}.yaml"
+        self._saved_data = None
         
         # Save default config to file
         self.save(profile)
@@ -178,6 +209,10 @@ class ConfigManager(QObject):
         """
         Set configuration value.
         
+        Setting a value equal to the current one is a no-op (no signal).
+        Passing back the current mutable object itself, e.g. a list changed
+        in place, always signals since there is nothing left to compare.
+        
         Args:
             section: Config section (e.g., 'audio')
             key: Key within section (e.g., 'device_id')
@@ -190,9 +225,46 @@ class ConfigManager(QObject):
             self.load_or_create_default()
         
         section_obj = getattr(self._config, section)
+        # Unknown keys fall through so pydantic raises its usual error
+        current = getattr(section_obj, key, _UNSET)
+        if current is not _UNSET and current == value and (
+            current is not value or type(value).__hash__ is not None
+        ):
+            return
         setattr(section_obj, key, value)
         
-        self.config_changed.emit(section)
+        if self._batch_depth:
+            self._batched_sections[section] = None
+        else:
+            self.config_changed.emit(section)
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group several set() calls into a single save.
+        
+        config_changed is emitted once per changed section when the
+        outermost batch exits, followed by one save(). If the block raises,
+        the change signals still fire (the in-memory config was modified)
+        but nothing is written.
+        
+        Example:
+            >>> with config.batch():
+            ...     config.set('ui', 'minimize_to_tray', True)
+            ...     config.set('ui', 'start_minimized', True)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                sections, self._batched_sections = self._batched_sections, {}
+                for section in sections:
+                    self.config_changed.emit(section)
+        
+        if not self._batch_depth and self._config is not None:
+            self.save()
     
     def get_plugin_config(self, plugin_name: str) -> dict:
         """
@@ -5,7 +5,9 @@ These models provide type safety, validation, and clear documentation
 for all configuration options.
 """
 
-from typing import Optional, Literal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, ClassVar, FrozenSet, Mapping, Optional, Literal, Type, get_args
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -101,18 +103,24 @@ class HotkeyConfig(BaseModel):
         return '+'.join(sorted(keys))
 
 
+WhisperModel = Literal[
+    "tiny", "tiny.en", "base", "base.en", "small", "small.en", 
+    "medium", "medium.en", "large", "large-v1", "large-v2", "large-v3",
+    "distil-medium.en", "distil-large-v3"
+]
+
+
 class WhisperConfig(BaseModel):
     """Whisper transcription model configuration."""
     
+    # Accepted model names, for membership checks without building a config
+    VALID_MODELS: ClassVar[FrozenSet[str]] = frozenset(get_args(WhisperModel))
+    
     use_api: bool = Field(
         default=False,
         description="Use OpenAI API instead of local model"
     )
-    model: Literal[
-        "tiny", "tiny.en", "base", "base.en", "small", "small.en", 
-        "medium", "medium.en", "large", "large-v1", "large-v2", "large-v3",
-        "distil-medium.en", "distil-large-v3"
-    ] = Field(
+    model: WhisperModel = Field(
         default="base",
         description="Whisper model size (larger = more accurate, slower). Distil models are 6x faster."
     )
@@ -258,3 +266,25 @@ class AppConfig(BaseModel):
         """Pydantic configuration."""
         validate_assignment = True  # Validate on field assignment
         extra = "forbid"  # Raise error on unknown fields
+
+
+@lru_cache(maxsize=None)
+def default_values(model: Type[BaseModel]) -> Mapping[str, Any]:
+    """
+    Read-only field defaults for a config model, computed once per class.
+
+    Callers that only need to know a default (reset buttons, tests) read
+    this instead of constructing and validating a throwaway instance.
+    Nested sections are returned as nested read-only mappings.
+    """
+    values = {}
+    for name, field in model.model_fields.items():
+        value = field.get_default(call_default_factory=True)
+        if isinstance(value, BaseModel):
+            value = default_values(type(value))
+        elif isinstance(value, list):
+            value = tuple(value)
+        elif isinstance(value, dict):
+            value = MappingProxyType(value)
+        values[name] = value
+    return MappingProxyType(values)
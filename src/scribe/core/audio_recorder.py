@@ -15,6 +15,49 @@ from PyQt5.QtCore import QObject, pyqtSignal as Signal, QTimer
 
 logger = logging.getLogger(__name__)
 
+_INT16_MAX = float(np.iinfo(np.int16).max)
+
+
+class AudioBuffer:
+    """
+    Preallocated, contiguous sample buffer filled by the audio callback.
+    
+    Replaces a list of per-callback chunk arrays: each append copies into one
+    block allocated up front, so the audio thread makes no allocations and
+    stopping needs no concatenate. Keeps the append/clear/len/bool surface of
+    the list it replaces.
+    """
+    
+    def __init__(self, max_frames: int, channels: int, dtype: str):
+        self._data = np.empty((max_frames, channels), dtype=dtype)
+        self._frames = 0
+    
+    @property
+    def capacity(self) -> int:
+        """Maximum number of frames the buffer holds."""
+        return self._data.shape[0]
+    
+    @property
+    def channels(self) -> int:
+        return self._data.shape[1]
+    
+    def append(self, chunk: np.ndarray):
+        """Copy a (frames, channels) chunk in; frames beyond capacity are dropped."""
+        n = min(len(chunk), self.capacity - self._frames)
+        self._data[self._frames:self._frames + n] = chunk[:n]
+        self._frames += n
+    
+    def clear(self):
+        """Forget recorded frames (the allocation is kept for reuse)."""
+        self._frames = 0
+    
+    def view(self) -> np.ndarray:
+        """Recorded frames as a (frames, channels) view; valid until the next clear."""
+        return self._data[:self._frames]
+    
+    def __len__(self) -> int:
+        return self._frames
+
 
 class AudioRecorder(QObject):
     """
@@ -46,7 +89,8 @@ class AudioRecorder(QObject):
         
         # State
         self.is_recording = False
-        self.audio_data = []
+        self._max_recording_seconds = 120  # 2 minute safety limit
+        self.audio_data = self._prepare_buffer()
         self._last_level = 0.0
         self._is_monitoring = False
         self.device_id = None  # None = default device
@@ -171,10 +215,9 @@ class AudioRecorder(QObject):
                     logger.error(f"Invalid device {self.device_id}: {e}. Falling back to default.")
                     self.device_id = None
             
-            self.audio_data = []
+            self.audio_data = self._prepare_buffer()
             self.is_recording = True
             self._recording_start_time = datetime.now()
-            self._max_recording_seconds = 120  # 2 minute safety limit
 
             logger.info(f"Starting recording (device={self.device_id}, rate={self.sample_rate}Hz)")
 
@@ -216,6 +259,31 @@ class AudioRecorder(QObject):
             logger.error(error_msg, exc_info=True)
             self.error_occurred.emit(error_msg)
     
+    def _prepare_buffer(self) -> AudioBuffer:
+        """Return an empty buffer sized for the longest allowed recording, reusing the current one when it fits."""
+        # One second of slack for blocks already in flight when the limit trips
+        max_frames = (self._max_recording_seconds + 1) * self.sample_rate
+        buffer = getattr(self, 'audio_data', None)
+        if not (isinstance(buffer, AudioBuffer)
+                and buffer.capacity == max_frames and buffer.channels == self.channels):
+            buffer = AudioBuffer(max_frames, self.channels, self.dtype)
+        buffer.clear()
+        return buffer
+    
+    @staticmethod
+    def _compute_level(chunk: np.ndarray) -> float:
+        """
+        Normalized 0.0-1.0 VU level of an int16 block, from its RMS (x4 gain for speech).
+        
+        The sum of squares is one float32 dot product (a single SIMD reduction)
+        instead of squaring into a temporary array and averaging it.
+        """
+        samples = chunk.astype(np.float32).ravel()
+        if not samples.size:
+            return 0.0
+        rms = float(np.sqrt(np.dot(samples, samples) / samples.size))
+        return min(1.0, rms / _INT16_MAX * 4.0)
+    
     def _emit_level(self):
         """Emit level change from main thread (called by timer)."""
         if (self.is_recording or self._is_monitoring) and hasattr(self, '_last_level'):
@@ -237,12 +305,9 @@ class AudioRecorder(QObject):
                         self.is_recording = False
                         return
                 
-                chunk = indata.copy()
-                self.audio_data.append(chunk)
+                self.audio_data.append(indata)  # Copied into the preallocated buffer
                 try:
-                    rms = float(np.sqrt(np.mean(chunk.astype(np.float32) ** 2)))
-                    normalized = min(1.0, rms / np.iinfo(np.int16).max * 4.0)
-                    self._last_level = normalized
+                    self._last_level = self._compute_level(indata)
                     # DON'T emit Qt signals from audio thread - causes segfault!
                     # Signal will be emitted from main thread via timer
                 except Exception as e:
@@ -285,19 +350,13 @@ class AudioRecorder(QObject):
                 finally:
                     if hasattr(self, 'stream'):
                         del self.stream  # Ensure complete cleanup
-            # Concatenate all audio chunks
+            # Recorded frames are already contiguous in the buffer
             if not self.audio_data:
                 logger.warning("No audio data captured")
                 self.recording_stopped.emit(b"")
                 return b""
             
-            logger.debug(f"Concatenating {len(self.audio_data)} audio chunks...")
-            try:
-                audio_array = np.concatenate(self.audio_data, axis=0)
-            except Exception as e:
-                logger.error(f"Failed to concatenate audio chunks: {e}", exc_info=True)
-                self.recording_stopped.emit(b"")
-                return b""
+            audio_array = self.audio_data.view()
             
             duration = len(audio_array) / self.sample_rate
             
@@ -470,10 +529,7 @@ class AudioRecorder(QObject):
                 try:
                     if status:
                         logger.debug(f"Monitor status: {status}")
-                    chunk = indata
-                    rms = float(np.sqrt(np.mean(chunk.astype(np.float32) ** 2)))
-                    normalized = min(1.0, rms / np.iinfo(np.int16).max * 4.0)
-                    self._last_level = normalized
+                    self._last_level = self._compute_level(indata)
                 except Exception:
                     pass
 
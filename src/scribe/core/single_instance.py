@@ -13,6 +13,11 @@ from pathlib import Path
 from typing import Optional, Tuple
 from datetime import datetime
 
+try:
+    from filelock import FileLock  # serialises concurrent acquire() calls
+except ImportError:  # pragma: no cover - optional dependency
+    FileLock = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -214,10 +219,21 @@ class SingleInstanceManager:
         """
         Acquire single instance lock.
         
+        When ``filelock`` is installed, the read-compare-write below runs under
+        an OS-level lock on ``<lock_file>.lock`` so two instances starting at
+        the same moment cannot both find the lock free.
+        
         Returns:
             True if lock acquired (either new or upgraded from old version/build)
             False if another instance is running and cannot be replaced
         """
+        if FileLock is None:
+            return self._acquire_unguarded()
+        with FileLock(f"{self.lock_file}.lock"):
+            return self._acquire_unguarded()
+    
+    def _acquire_unguarded(self) -> bool:
+        """Decide and write the instance lock; see acquire()."""
         lock_info = self._read_lock_info()
         
         if lock_info is None:
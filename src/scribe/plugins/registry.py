@@ -9,16 +9,31 @@ import importlib
 import importlib.util
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Sequence, Tuple
 from dataclasses import dataclass
 
 from .base import BasePlugin, CommandDefinition, PluginError
 from .loader import load_plugins
 
+try:
+    import ahocorasick  # type: ignore  # pyahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
 
 logger = logging.getLogger(__name__)
 
 
+def _literal_prefix(pattern: str) -> str:
+    """Normalized literal words of a pattern before its first {placeholder}."""
+    words = []
+    for part in pattern.strip().lower().split():
+        if part.startswith("{") and part.endswith("}"):
+            break
+        words.append(part)
+    return " ".join(words)
+
+
 @dataclass
 class RegisteredCommand:
     """A command registered by a plugin with routing information."""
@@ -55,6 +70,7 @@ class PluginRegistry:
         self._plugins: Dict[str, BasePlugin] = {}
         self._commands: Dict[str, List[RegisteredCommand]] = {}
         self._plugin_configs: Dict[str, Dict[str, Any]] = {}
+        self._dispatch = None  # Flat dispatch table + prefilter, built lazily by candidate_commands()
 
     def register_plugin(self, plugin: BasePlugin, config: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -122,6 +138,7 @@ class PluginRegistry:
                 pattern=pattern
             )
             self._commands[pattern].append(registered_cmd)
+            self._dispatch = None
             logger.debug(f"Registered command pattern: '{pattern}' -> {plugin.name}")
 
     def unregister_plugin(self, plugin_name: str) -> bool:
@@ -155,6 +172,7 @@ class PluginRegistry:
 
         for pattern in patterns_to_remove:
             del self._commands[pattern]
+        self._dispatch = None
 
         # Remove plugin
         del self._plugins[plugin_name]
@@ -206,6 +224,60 @@ class PluginRegistry:
         """
         return self._commands.get(pattern)
 
+    def candidate_commands(self, text: str) -> Sequence[Tuple[str, str, RegisteredCommand]]:
+        """
+        Dispatch table rows that could match an utterance, in registration order.
+
+        The dispatch table is a flat sequence of (pattern, key, command) rows,
+        one per distinct pattern, holding the pattern's stripped, lower-cased
+        matching key and the first command registered for it.
+        A pattern can only match if its literal words before the first
+        {placeholder} occur in the text, so with pyahocorasick installed a
+        single scan of the text rules out every other row before any regex
+        runs. Without it, the whole table is returned.
+
+        Args:
+            text: Transcribed utterance
+
+        Returns:
+            (pattern, key, RegisteredCommand) rows to try, in registration order
+        """
+        if self._dispatch is None:
+            self._dispatch = self._build_dispatch()
+        table, automaton, always = self._dispatch
+        if automaton is None:
+            return table
+
+        hits = set(always)
+        if len(automaton):
+            for _, rows in automaton.iter(" ".join(text.lower().split())):
+                hits.update(rows)
+        return [table[i] for i in sorted(hits)]
+
+    def _build_dispatch(self):
+        """Flatten _commands into the dispatch table and index its literal prefixes."""
+        table = tuple(
+            (pattern, pattern.strip().lower(), cmds[0]) for pattern, cmds in self._commands.items()
+        )
+        if ahocorasick is None:
+            return table, None, ()
+
+        by_prefix: Dict[str, List[int]] = {}
+        always = []
+        for i, (_, key, _) in enumerate(table):
+            prefix = _literal_prefix(key)
+            if prefix:
+                by_prefix.setdefault(prefix, []).append(i)
+            else:
+                always.append(i)  # Starts with a placeholder: no literal to scan for
+
+        automaton = ahocorasick.Automaton()
+        for prefix, rows in by_prefix.items():
+            automaton.add_word(prefix, tuple(rows))
+        if by_prefix:
+            automaton.make_automaton()
+        return table, automaton, always
+
     def execute_command(self, pattern: str, **kwargs) -> Any:
         """
         Execute a command by pattern with provided arguments.
@@ -2,8 +2,11 @@
 Home Page - Modern dashboard with stats, activity, and quick actions
 """
 
+import logging
 from datetime import datetime, timedelta
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal as Signal
+from typing import Dict
+from PyQt5 import sip
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal as Signal
 from PyQt5.QtGui import QColor, QFont
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 from qfluentwidgets import (
@@ -28,6 +31,47 @@ from ..branding import (
 from ..widgets import ValueCard
 from .home_modern import StatCard, RecentActivityCard, QuickActionCard
 
+logger = logging.getLogger(__name__)
+
+
+def _format_duration(seconds: float) -> str:
+    """Format seconds as 'Hh Mm', or just 'Mm' under an hour."""
+    minutes = int(seconds // 60)
+    return f"{minutes // 60}h {minutes % 60}m" if minutes >= 60 else f"{minutes}m"
+
+
+class _SummarySignals(QObject):
+    """Carries a formatted summary from the pool thread back to the GUI thread."""
+    ready = Signal(object, dict)
+
+
+class _SummaryTask(QRunnable):
+    """Compute and format the session summary off the GUI thread."""
+
+    def __init__(self, value_calculator, signals: _SummarySignals, token: object):
+        super().__init__()
+        self.value_calculator = value_calculator
+        self.signals = signals
+        self.token = token
+
+    def run(self):
+        try:
+            summary = self.value_calculator.get_session_summary()
+            texts = {
+                "transcriptions": str(summary.total_transcriptions),
+                "words": f"{summary.total_words:,}",
+                "time": _format_duration(summary.time_saved_vs_typing),
+                "accuracy": f"{summary.accuracy_score * 100:.1f}%",
+                "commands": str(summary.total_commands),
+            }
+        except Exception:
+            logger.exception("Failed to compute session summary")
+            return
+        try:
+            self.signals.ready.emit(self.token, texts)
+        except RuntimeError:
+            pass  # The page, and its signals object with it, was destroyed meanwhile
+
 
 class HomePage(ScrollArea):
     """Modern home dashboard with crisp design"""
@@ -52,6 +96,7 @@ class HomePage(ScrollArea):
         self.words_saved = 0
         self.time_saved_seconds = 0
         self.recent_transcriptions = []
+        self._labels = self._build_labels()
 
         self.view = QWidget()
         self.setWidget(self.view)
@@ -95,9 +140,43 @@ class HomePage(ScrollArea):
         self.accuracy_card = None
         self.commands_card = None
 
+        # Cards start at their "0" placeholders; real values arrive from the
+        # thread pool so the summary never blocks building the page
+        # Parented to the page so its connection dies with it
+        self._summary_signals = _SummarySignals(self)
+        self._summary_signals.ready.connect(self._apply_summary)
+        self._summary_token = None
+        self.refresh_metrics()
+
         # Force an initial relayout/repaint to avoid any stale paint until scroll
         QTimer.singleShot(0, self._refresh_first_paint)
 
+    @staticmethod
+    def _build_labels() -> Dict[str, str]:
+        """Static caption text for the dashboard sections, keyed by role.
+
+        Kept apart from widget construction so tests can look each caption
+        up in the built page (e.g. to catch a label added twice).
+        """
+        return {
+            "welcome_title": "Ready to transcribe",
+            "welcome_subtitle": "Press Ctrl+Alt anywhere to start recording",
+            "stats_header": "Today's Activity",
+            "stat_transcriptions": "Transcriptions",
+            "stat_words": "Words Saved",
+            "stat_words_hint": "Total typed for you",
+            "stat_time": "Time Saved",
+            "stat_time_hint": "Estimated typing time",
+            "action_record": "Start Recording",
+            "action_record_hint": "Press to begin",
+            "action_history": "View History",
+            "action_history_hint": "Browse past logs",
+            "action_insights": "View Insights",
+            "action_insights_hint": "See productivity",
+            "activity_header": "Recent Activity",
+            "activity_empty": "No recent transcriptions. Start recording to see activity!",
+        }
+
     def showEvent(self, event):
         super().showEvent(event)
         # Ensure a clean layout/paint right after the page is shown
@@ -446,10 +525,7 @@ class HomePage(ScrollArea):
             summary = self.value_calculator.get_session_summary()
 
             # Format time saved (convert seconds to hours and minutes)
-            time_saved_seconds = summary.time_saved_vs_typing
-            hours = int(time_saved_seconds // 3600)
-            minutes = int((time_saved_seconds % 3600) // 60)
-            time_saved_str = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+            time_saved_str = _format_duration(summary.time_saved_vs_typing)
 
             # Format word count
             words_str = f"{summary.total_words:,}"
@@ -516,34 +592,30 @@ class HomePage(ScrollArea):
         return container
 
     def refresh_metrics(self):
-        """Refresh metric cards with latest data"""
+        """Refresh metric cards with latest data (applied asynchronously)"""
         if not self.value_calculator:
             return
 
-        summary = self.value_calculator.get_session_summary()
-
-        # Update time saved
-        if self.time_card:
-            time_saved_seconds = summary.time_saved_vs_typing
-            hours = int(time_saved_seconds // 3600)
-            minutes = int((time_saved_seconds % 3600) // 60)
-            time_saved_str = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
-            self.time_card.set_value(time_saved_str)
+        # A fresh token supersedes any summary still in flight
+        self._summary_token = object()
+        QThreadPool.globalInstance().start(
+            _SummaryTask(self.value_calculator, self._summary_signals, self._summary_token)
+        )
 
-        # Update word count
-        if self.words_card:
-            words_str = f"{summary.total_words:,}"
-            self.words_card.set_value(words_str)
+    def _apply_summary(self, token, texts: dict):
+        """Write a formatted summary into the cards (GUI thread)"""
+        if sip.isdeleted(self) or token is not self._summary_token:
+            return  # Page gone, or superseded by a newer refresh or by update_stats()
+        self._summary_token = None
 
-        # Update accuracy
-        if self.accuracy_card:
-            accuracy_str = f"{summary.accuracy_score * 100:.1f}%"
-            self.accuracy_card.set_value(accuracy_str)
+        self.stat_transcriptions.update_value(texts["transcriptions"], animate=False)
+        self.stat_words.update_value(texts["words"], animate=False)
+        self.stat_time.update_value(texts["time"], animate=False)
 
-        # Update command count
-        if self.commands_card:
-            commands_str = f"{summary.total_commands}"
-            self.commands_card.set_value(commands_str)
+        for card, key in ((self.time_card, "time"), (self.words_card, "words"),
+                          (self.accuracy_card, "accuracy"), (self.commands_card, "commands")):
+            if card:
+                card.set_value(texts[key])
     
     def _create_stats_section(self):
         """Create stats section with simple header"""
@@ -556,7 +628,7 @@ class HomePage(ScrollArea):
         header_container = QWidget()
         header_layout = QHBoxLayout(header_container)
         header_layout.setContentsMargins(0, 0, 0, 0)
-        title = SubtitleLabel("Today's Activity")
+        title = SubtitleLabel(self._labels["stats_header"])
         header_layout.addWidget(title)
         header_layout.addStretch()
         layout.addWidget(header_container)
@@ -567,7 +639,7 @@ class HomePage(ScrollArea):
         
         self.stat_transcriptions = StatCard(
             FIF.DOCUMENT,
-            "Transcriptions",
+            self._labels["stat_transcriptions"],
             "0",
             parent=self
         )
@@ -575,18 +647,18 @@ class HomePage(ScrollArea):
         
         self.stat_words = StatCard(
             FIF.EDIT,
-            "Words Saved",
+            self._labels["stat_words"],
             "0",
-            "Total typed for you",
+            self._labels["stat_words_hint"],
             parent=self
         )
         stats_layout.addWidget(self.stat_words)
         
         self.stat_time = StatCard(
             FIF.HISTORY,
-            "Time Saved",
+            self._labels["stat_time"],
             "0m",
-            "Estimated typing time",
+            self._labels["stat_time_hint"],
             parent=self
         )
         stats_layout.addWidget(self.stat_time)
@@ -604,10 +676,10 @@ class HomePage(ScrollArea):
         layout.setSpacing(8)
         
         # Simple welcome text
-        title = SubtitleLabel("Ready to transcribe")
+        title = SubtitleLabel(self._labels["welcome_title"])
         layout.addWidget(title)
         
-        subtitle = BodyLabel("Press Ctrl+Alt anywhere to start recording")
+        subtitle = BodyLabel(self._labels["welcome_subtitle"])
         subtitle.setTextColor(QColor(150, 150, 150), QColor(150, 150, 150))
         layout.addWidget(subtitle)
         
@@ -623,8 +695,8 @@ class HomePage(ScrollArea):
         # Start Recording Card
         self.record_card = QuickActionCard(
             FIF.MICROPHONE,
-            "Start Recording",
-            "Press to begin",
+            self._labels["action_record"],
+            self._labels["action_record_hint"],
             parent=self
         )
         self.record_card.clicked.connect(self.start_listening_clicked)
@@ -633,8 +705,8 @@ class HomePage(ScrollArea):
         # View History Card
         self.history_card = QuickActionCard(
             FIF.HISTORY,
-            "View History",
-            "Browse past logs",
+            self._labels["action_history"],
+            self._labels["action_history_hint"],
             parent=self
         )
         self.history_card.clicked.connect(self.view_history_clicked)
@@ -643,8 +715,8 @@ class HomePage(ScrollArea):
         # View Insights Card
         self.insights_card = QuickActionCard(
             FIF.INFO,
-            "View Insights",
-            "See productivity",
+            self._labels["action_insights"],
+            self._labels["action_insights_hint"],
             parent=self
         )
         self.insights_card.clicked.connect(self.view_insights_clicked)
@@ -663,7 +735,7 @@ class HomePage(ScrollArea):
         header_container = QWidget()
         header_layout = QHBoxLayout(header_container)
         header_layout.setContentsMargins(0, 0, 0, 0)
-        title = SubtitleLabel("Recent Activity")
+        title = SubtitleLabel(self._labels["activity_header"])
         header_layout.addWidget(title)
         header_layout.addStretch()
         layout.addWidget(header_container)
@@ -675,7 +747,7 @@ class HomePage(ScrollArea):
         self.activity_layout.setContentsMargins(0, 0, 0, 0)
         
         # Placeholder
-        self.no_activity_label = BodyLabel("No recent transcriptions. Start recording to see activity!", self)
+        self.no_activity_label = BodyLabel(self._labels["activity_empty"], self)
         self.activity_layout.addWidget(self.no_activity_label)
         
         layout.addWidget(self.activity_container)
@@ -687,6 +759,7 @@ class HomePage(ScrollArea):
         self.total_transcriptions = total_transcriptions
         self.words_saved = words_saved
         self.time_saved_seconds = time_saved_seconds
+        self._summary_token = None  # Explicit stats win over a pending summary
         
         # Update stat cards
         if hasattr(self, 'stat_transcriptions'):
@@ -694,13 +767,7 @@ class HomePage(ScrollArea):
         if hasattr(self, 'stat_words'):
             self.stat_words.update_value(f"{words_saved:,}")
         if hasattr(self, 'stat_time'):
-            minutes = time_saved_seconds // 60
-            if minutes < 60:
-                time_str = f"{minutes}m"
-            else:
-                hours = minutes // 60
-                time_str = f"{hours}h {minutes % 60}m"
-            self.stat_time.update_value(time_str)
+            self.stat_time.update_value(_format_duration(time_saved_seconds))
     
     def update_recent_activity(self, transcriptions: list):
         """Update recent activity cards"""
@@ -713,7 +780,7 @@ class HomePage(ScrollArea):
                 item.widget().deleteLater()
         
         if not transcriptions:
-            self.no_activity_label = BodyLabel("No recent transcriptions. Start recording to see activity!", self)
+            self.no_activity_label = BodyLabel(self._labels["activity_empty"], self)
             self.activity_layout.addWidget(self.no_activity_label)
         else:
             # Show up to 5 recent transcriptions
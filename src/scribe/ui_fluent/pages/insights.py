@@ -19,6 +19,11 @@ class InsightsPage(ScrollArea):
         self.value_calculator = value_calculator
         self.event_count = 0  # Track number of events received
         
+        # Cards from the last _generate_insights() and the calculator
+        # version they were built from
+        self._insights_cache = None
+        self._cache_key = None
+        
         self.view = QWidget()
         self.setWidget(self.view)
         self.setWidgetResizable(True)
@@ -58,8 +63,16 @@ class InsightsPage(ScrollArea):
         """Update insights with new summary data"""
         self._regenerate_insights()
     
+    def _insights_key(self):
+        """Calculator version the insights depend on (None without a calculator)"""
+        return self.value_calculator.version if self.value_calculator else None
+    
     def _regenerate_insights(self):
         """Clear and regenerate all insight cards with current data"""
+        # Nothing recorded since the cards on screen were built
+        if self._insights_cache is not None and self._insights_key() == self._cache_key:
+            return
+        
         # Clear existing insights
         while self.insights_layout.count():
             item = self.insights_layout.takeAt(0)
@@ -74,7 +87,11 @@ class InsightsPage(ScrollArea):
             self.insights_layout.addWidget(insight)
     
     def _generate_insights(self):
-        """Generate insights from real usage data"""
+        """Generate insights from real usage data, reusing the last cards if nothing was recorded since"""
+        key = self._insights_key()
+        if self._insights_cache is not None and key == self._cache_key:
+            return self._insights_cache
+        
         insights = []
         
         if self.value_calculator:
@@ -152,4 +169,6 @@ class InsightsPage(ScrollArea):
                 )
             ]
         
+        self._insights_cache = insights
+        self._cache_key = key
         return insights
@@ -13,7 +13,7 @@ from qfluentwidgets import (
     InfoBar, InfoBarPosition, MessageBox, IconWidget
 )
 
-from scribe.config import ConfigManager
+from scribe.config import ConfigManager, HotkeyConfig, default_values
 from ..branding import (
     SPACING_XS, SPACING_SM, SPACING_MD, SPACING_LG,
     CARD_PADDING, SECTION_SPACING, PAGE_MARGIN,
@@ -1201,34 +1201,35 @@ class SettingsPage(ScrollArea):
                 button_text = self.hotkey_button.text()
                 hotkey_text = button_text.replace('✓ ', '').replace('⌨️ ', '').lower().strip()
             
-            if hotkey_text:
-                # Convert windows to meta for storage
-                storage_key = hotkey_text.replace('windows', 'meta')
-                self.config_manager.set('hotkey', 'activation_key', storage_key)
+            with self.config_manager.batch():
+                if hotkey_text:
+                    # Convert windows to meta for storage
+                    storage_key = hotkey_text.replace('windows', 'meta')
+                    self.config_manager.set('hotkey', 'activation_key', storage_key)
 
-            # UI settings
-            self.config_manager.set('ui', 'minimize_to_tray', self.minimize_tray_switch.isChecked())
-            self.config_manager.set('ui', 'show_system_tray', self.show_tray_switch.isChecked())
-            self.config_manager.set('ui', 'start_minimized', self.start_minimized_switch.isChecked())
-            self.config_manager.set('ui', 'theme', self.theme_combo.currentData())
-            
-            # Audio settings
-            device_id = self.device_combo.currentData()
-            self.config_manager.set('audio', 'device_id', device_id)
-            self.config_manager.set('audio', 'sample_rate', self.rate_combo.currentData())
-            
-            # Whisper settings
-            self.config_manager.set('whisper', 'model', self.model_combo.currentData())
-            self.config_manager.set('whisper', 'device', self.compute_device_combo.currentData())
-            self.config_manager.set('whisper', 'compute_type', self.compute_type_combo.currentData())
-            
-            # Language setting (if user changed it)
-            lang_code = self.language_combo.currentData()
-            if lang_code:
-                self.config_manager.set('whisper', 'language', lang_code if lang_code != "auto" else None)
+                # UI settings
+                self.config_manager.set('ui', 'minimize_to_tray', self.minimize_tray_switch.isChecked())
+                self.config_manager.set('ui', 'show_system_tray', self.show_tray_switch.isChecked())
+                self.config_manager.set('ui', 'start_minimized', self.start_minimized_switch.isChecked())
+                self.config_manager.set('ui', 'theme', self.theme_combo.currentData())
+                
+                # Audio settings
+                device_id = self.device_combo.currentData()
+                self.config_manager.set('audio', 'device_id', device_id)
+                self.config_manager.set('audio', 'sample_rate', self.rate_combo.currentData())
+                
+                # Whisper settings
+                self.config_manager.set('whisper', 'model', self.model_combo.currentData())
+                self.config_manager.set('whisper', 'device', self.compute_device_combo.currentData())
+                self.config_manager.set('whisper', 'compute_type', self.compute_type_combo.currentData())
+                
+                # Language setting (if user changed it)
+                lang_code = self.language_combo.currentData()
+                if lang_code:
+                    self.config_manager.set('whisper', 'language', lang_code if lang_code != "auto" else None)
             
-            # Save to file
-            saved_path = self.config_manager.save()
+            # batch() saved on exit
+            saved_path = self.config_manager.config_file
             logger.info(f"Configuration saved successfully to {saved_path}")
             
             InfoBar.success(
@@ -1326,10 +1327,10 @@ class SettingsPage(ScrollArea):
     def _auto_save_ui_setting(self):
         """Auto-save UI settings when changed."""
         try:
-            self.config_manager.set('ui', 'minimize_to_tray', self.minimize_tray_switch.isChecked())
-            self.config_manager.set('ui', 'show_system_tray', self.show_tray_switch.isChecked())
-            self.config_manager.set('ui', 'start_minimized', self.start_minimized_switch.isChecked())
-            self.config_manager.save()
+            with self.config_manager.batch():
+                self.config_manager.set('ui', 'minimize_to_tray', self.minimize_tray_switch.isChecked())
+                self.config_manager.set('ui', 'show_system_tray', self.show_tray_switch.isChecked())
+                self.config_manager.set('ui', 'start_minimized', self.start_minimized_switch.isChecked())
             logger.info("UI settings auto-saved")
         except Exception as e:
             logger.error(f"Failed to auto-save UI setting: {e}", exc_info=True)
@@ -1352,15 +1353,15 @@ class SettingsPage(ScrollArea):
                 )
                 return
 
-            self.config_manager.set('audio', 'device_id', device_id)
-            self.config_manager.set('audio', 'sample_rate', self.rate_combo.currentData())
-            # Processing options
-            self.config_manager.set('audio', 'noise_suppression', self.noise_supp_switch.isChecked())
-            self.config_manager.set('audio', 'vad_aggressiveness', self.vad_combo.currentData())
-            self.config_manager.set('audio', 'noise_gate_db', self.gate_combo.currentData())
-            self.config_manager.set('audio', 'level_normalization', self.level_norm_switch.isChecked())
-            self.config_manager.set('audio', 'target_level_dbfs', self.level_target_combo.currentData())
-            self.config_manager.save()
+            with self.config_manager.batch():
+                self.config_manager.set('audio', 'device_id', device_id)
+                self.config_manager.set('audio', 'sample_rate', self.rate_combo.currentData())
+                # Processing options
+                self.config_manager.set('audio', 'noise_suppression', self.noise_supp_switch.isChecked())
+                self.config_manager.set('audio', 'vad_aggressiveness', self.vad_combo.currentData())
+                self.config_manager.set('audio', 'noise_gate_db', self.gate_combo.currentData())
+                self.config_manager.set('audio', 'level_normalization', self.level_norm_switch.isChecked())
+                self.config_manager.set('audio', 'target_level_dbfs', self.level_target_combo.currentData())
             logger.info("Audio settings auto-saved")
         except Exception as e:
             logger.error(f"Failed to auto-save audio setting: {e}", exc_info=True)
@@ -1537,7 +1538,7 @@ class SettingsPage(ScrollArea):
     
     def _reset_hotkey(self):
         """Reset hotkey to default (Ctrl+Alt)."""
-        default_hotkey = "ctrl+alt"
+        default_hotkey = default_values(HotkeyConfig)["activation_key"]
         self.hotkey_button.setText(f"✓ {default_hotkey.upper()}")
         self.hotkey_button.setStyleSheet("""
             PushButton {
@@ -6,9 +6,9 @@ Allows user to select their microphone and test recording.
 
 import os
 import subprocess
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QWidget, QApplication
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal as Signal
 from qfluentwidgets import (
     CardWidget, BodyLabel, StrongBodyLabel,
     ComboBox, PushButton, ProgressBar, InfoBar, InfoBarPosition
@@ -29,6 +29,17 @@ class AudioDevicePage(BasePage):
     - Verify audio levels are working
     """
 
+    # Signals
+    analysis_finished = Signal()  # Emitted when a test recording has been analyzed (pass or fail)
+
+    TEST_DURATION_MS = 3000  # Length of the microphone test recording
+
+    # Level thresholds for the test recording verdict (float samples, full scale = 1.0)
+    MIN_AMPLITUDE = 0.01
+    CLIP_PEAK = 0.95
+    MIN_RMS = 0.001
+    MAX_RMS = 0.8
+
     def __init__(self, parent=None):
         """Initialize the audio device page."""
         super().__init__(parent)  # Initialize QWidget through the parent classes
@@ -340,8 +351,8 @@ class AudioDevicePage(BasePage):
             # Start level visualization timer
             self.level_timer.start(100)  # Update every 100ms
             
-            # Record for 3 seconds with timeout protection
-            duration = 3  # seconds
+            # Record for TEST_DURATION_MS with timeout protection
+            duration = self.TEST_DURATION_MS / 1000  # seconds
             
             import threading
             import queue
@@ -415,7 +426,6 @@ class AudioDevicePage(BasePage):
             # Analyze recording
             if self.audio_data and hasattr(self, 'audio_stats'):
                 audio_array = np.concatenate(self.audio_data, axis=0)
-                max_amplitude = np.abs(audio_array).max()
                 
                 # Calculate quality metrics
                 avg_rms = np.mean([s['rms'] for s in self.audio_stats])
@@ -425,15 +435,10 @@ class AudioDevicePage(BasePage):
                 # Quality checks
                 quality_issues = []
                 
-                if max_amplitude < 0.01:
-                    quality_issues.append("Very low audio levels detected")
-                elif max_peak > 0.95:
-                    quality_issues.append("Audio clipping detected")
-                    
-                if avg_rms < 0.001:
-                    quality_issues.append("Low signal strength")
-                elif avg_rms > 0.8:
-                    quality_issues.append("Signal may be too hot")
+                _, level_issues = self._analyze_audio_quality(
+                    rms=avg_rms, peak=max_peak, amplitude=np.abs(audio_array).max()
+                )
+                quality_issues.extend(level_issues)
                     
                 if signal_variance < 0.00001:
                     quality_issues.append("Possible constant noise or DC offset")
@@ -556,6 +561,33 @@ class AudioDevicePage(BasePage):
             self.is_recording = False
             self.test_button.setEnabled(True)
             print("Test completed, resources cleaned up")
+            self.analysis_finished.emit()
+    
+    def _analyze_audio_quality(self, rms: float, peak: float, amplitude: float) -> Tuple[ValidationState, List[str]]:
+        """
+        Judge the input level of a test recording.
+        
+        Args:
+            rms: Average RMS level of the recording
+            peak: Maximum peak level of the recording
+            amplitude: Maximum absolute sample of the whole recording
+            
+        Returns:
+            (validation state, level issues to report; empty when VALID)
+        """
+        issues = []
+        
+        if amplitude < self.MIN_AMPLITUDE:
+            issues.append("Very low audio levels detected")
+        elif peak > self.CLIP_PEAK:
+            issues.append("Audio clipping detected")
+            
+        if rms < self.MIN_RMS:
+            issues.append("Low signal strength")
+        elif rms > self.MAX_RMS:
+            issues.append("Signal may be too hot")
+        
+        return (ValidationState.INVALID if issues else ValidationState.VALID), issues
     
     def _update_level(self):
         """Update the audio level bar during recording."""
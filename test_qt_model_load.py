@@ -1,4 +1,5 @@
 """Test faster-whisper model loading WITH Qt initialized"""
+import os
 import sys
 import logging
 
@@ -32,13 +33,13 @@ try:
     logger.info("Compute Type: int8")
     logger.info("Download Root: models")
     
+    # Let the int8 GEMMs use several OpenMP threads instead of serializing
     model = WhisperModel(
         "tiny",
         device="cpu",
         compute_type="int8",
         download_root="models",
-        num_workers=1,
-        cpu_threads=1
+        cpu_threads=max(2, (os.cpu_count() or 2) // 2)
     )
     
     logger.info("✅ Model loaded successfully!")
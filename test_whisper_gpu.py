@@ -2,9 +2,15 @@ import sys
 print("Testing faster-whisper GPU load...")
 
 try:
+    import ctranslate2
     from faster_whisper import WhisperModel
+
+    # flash_attention is only understood by CTranslate2 >= 4.3
+    ct2_version = tuple(int(part) for part in ctranslate2.__version__.split(".")[:2])
+    gpu_kwargs = {"flash_attention": True} if ct2_version >= (4, 3) else {}
+
     print("Creating model on CUDA...")
-    model = WhisperModel("tiny", device="cuda", compute_type="float16", download_root="models")
+    model = WhisperModel("tiny", device="cuda", compute_type="float16", download_root="models", **gpu_kwargs)
     print("Model loaded successfully on CUDA!")
 except Exception as e:
     print(f"CUDA failed: {e}")
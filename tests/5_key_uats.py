@@ -2,7 +2,15 @@
 """
 5 Key User Acceptance Tests - Enhanced WhisperWriter Showcase
 These tests demonstrate the most impressive enhancements over standard WhisperWriter
+
+Usage:
+    python tests/5_key_uats.py              # interactive
+    python tests/5_key_uats.py --timeout 30 # unanswered prompts fail after 30s
+    python tests/5_key_uats.py --auto       # non-interactive, every UAT passes
 """
+import argparse
+import sys
+import time
 
 def print_uat_header(test_num, title, description):
     print(f"\n{'='*70}")
@@ -24,26 +32,58 @@ def print_wow_factor(factor):
     print(f"\n🎉 WOW FACTOR:")
     print(f"   {factor}")
 
-def wait_for_result():
+def timed_input(prompt, timeout=None, default=""):
+    """input() that returns `default` if nothing is entered within `timeout` seconds."""
+    if timeout is None:
+        return input(prompt)
+
+    print(prompt, end="", flush=True)
+    if sys.platform == "win32":
+        import msvcrt
+        deadline = time.monotonic() + timeout
+        chars = []
+        while time.monotonic() < deadline:
+            if not msvcrt.kbhit():
+                time.sleep(0.05)
+                continue
+            ch = msvcrt.getwche()
+            if ch in ("\r", "\n"):
+                print()
+                return "".join(chars)
+            chars.append(ch)
+    else:
+        import select
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if ready:
+            return sys.stdin.readline().rstrip("\n")
+
+    print(f"\n   ⏱️ No answer after {timeout:g}s")
+    return default
+
+def wait_for_result(auto=False, timeout=None):
     print(f"\n❓ TEST RESULT:")
-    result = input("   Did you see the magic? (y/n): ").strip().lower()
+    if auto:
+        print("   ⏩ Auto mode: assuming pass")
+        return True
+    result = timed_input("   Did you see the magic? (y/n): ", timeout, default="n").strip().lower()
     if result == 'y':
         print("   ✅ AMAZING! Enhanced WhisperWriter working perfectly!")
         return True
     else:
         print("   ❌ Needs attention")
-        issue = input("   What happened instead? ").strip()
+        issue = timed_input("   What happened instead? ", timeout, default="(no answer)").strip()
         print(f"   Issue noted: {issue}")
         return False
 
-def run_showcase_uats():
+def run_showcase_uats(auto=False, timeout=None):
     print("🌟 ENHANCED WHISPERWRITER - 5 KEY UAT SHOWCASE")
     print("="*70)
     print("These tests demonstrate why this enhanced version is incredible!")
     print("Make sure WhisperWriter is running with: python complete_ai_monitor.py")
     print("="*70)
     
-    input("\nPress Enter when ready to start the magic... ")
+    if not auto:
+        timed_input("\nPress Enter when ready to start the magic... ", timeout)
     
     passed_tests = 0
     
@@ -67,7 +107,7 @@ def run_showcase_uats():
         "AI automatically removed ALL filler words (um, uh, like, you know, basically) and restructured the rambling into clear, professional sentences!"
     )
     
-    if wait_for_result():
+    if wait_for_result(auto, timeout):
         passed_tests += 1
     
     # UAT 2: Voice Formatting Commands
@@ -90,7 +130,7 @@ def run_showcase_uats():
         "Voice commands like 'new paragraph' and 'bullet point' actually FORMAT your document automatically!"
     )
     
-    if wait_for_result():
+    if wait_for_result(auto, timeout):
         passed_tests += 1
     
     # UAT 3: Smart Question Detection
@@ -113,7 +153,7 @@ def run_showcase_uats():
         "AI understands CONTEXT! Questions get '?' and statements get '.' automatically, plus 'three thirty' becomes '3:30'!"
     )
     
-    if wait_for_result():
+    if wait_for_result(auto, timeout):
         passed_tests += 1
     
     # UAT 4: Performance Monitoring in Action
@@ -136,7 +176,7 @@ def run_showcase_uats():
         "Professional-grade monitoring! You get real-time performance data, timing analytics, and session summaries like commercial software!"
     )
     
-    if wait_for_result():
+    if wait_for_result(auto, timeout):
         passed_tests += 1
     
     # UAT 5: Phantom Recording Protection
@@ -162,7 +202,7 @@ def run_showcase_uats():
         "Smart hotkey detection! Unlike basic WhisperWriter, this version NEVER triggers accidentally and only responds to the exact key combination!"
     )
     
-    if wait_for_result():
+    if wait_for_result(auto, timeout):
         passed_tests += 1
     
     # Results
@@ -200,5 +240,14 @@ def run_showcase_uats():
     print("   • Explore the personal dictionary features")
     print("   • Test with your specific vocabulary and speech patterns")
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the 5 key UAT showcase.")
+    parser.add_argument("--auto", "--assume-pass", action="store_true",
+                        help="don't prompt; record every UAT as passed")
+    parser.add_argument("--timeout", type=float, metavar="N",
+                        help="fail a UAT whose prompt is unanswered after N seconds")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    run_showcase_uats()
\ No newline at end of file
+    args = parse_args()
+    run_showcase_uats(auto=args.auto, timeout=args.timeout)
\ No newline at end of file
@@ -11,7 +11,9 @@ def benchmark_pipeline():
     # Setup dummy audio (5 seconds of silence/noise at 16kHz)
     duration = 5
     sr = 16000
-    audio_data = np.random.uniform(-0.5, 0.5, int(duration * sr)).astype(np.float32)
+    # Seeded float32 draw: reproducible across runs and no float64 scratch buffer
+    rng = np.random.default_rng(0)
+    audio_data = rng.random(duration * sr, dtype=np.float32) - np.float32(0.5)
     
     iterations = 50
     
@@ -0,0 +1,108 @@
+"""
+Shared pytest fixtures for the Scribe test suite.
+"""
+import ast
+import inspect
+import os
+import textwrap
+
+import pytest
+
+# Offscreen still renders into a surface (so widget sizing is real) without
+# needing a display or initialising the platform event pump.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Process-wide QApplication, themed once per interpreter.
+
+    Overrides pytest-qt's fixture so that repeated sessions in the same
+    process (xdist workers, --forked, IDE re-runs) reuse the existing app
+    instead of re-applying the theme to every registered widget.
+    """
+    from PyQt5.QtWidgets import QApplication
+    from qfluentwidgets import setTheme, Theme
+
+    app = QApplication.instance() or QApplication([])
+    if not getattr(app, "_scribe_themed", False):
+        setTheme(Theme.DARK)
+        app._scribe_themed = True
+    yield app
+
+
+@pytest.fixture(scope="session")
+def has_audio_hw():
+    """True if PortAudio loads and reports at least one device.
+
+    Probed once per session; on headless CI the backend scan can take
+    seconds before coming back empty.
+    """
+    try:
+        import sounddevice as sd
+        return len(sd.query_devices()) > 0
+    except Exception:
+        return False
+
+
+@pytest.fixture
+def requires_audio_hw(has_audio_hw):
+    """Skip the requesting test when no audio hardware is present.
+
+    Use via ``@pytest.mark.usefixtures("requires_audio_hw")`` so it also
+    works on unittest.TestCase methods.
+    """
+    if not has_audio_hw:
+        pytest.skip("no audio hardware")
+
+
+@pytest.fixture(scope="session")
+def enumerated_devices():
+    """AudioRecorder.list_devices(), enumerated once per session.
+
+    For tests that only consume the device list; tests of list_devices()
+    itself should keep calling it directly.
+    """
+    from scribe.core.audio_recorder import AudioRecorder
+
+    return AudioRecorder.list_devices()
+
+
+@pytest.fixture(scope="session")
+def plugin_registry():
+    """One empty PluginRegistry shared by the UI tests.
+
+    Pages only read from the registry, so there is no need to build a
+    fresh one (and re-run plugin discovery) for every window under test.
+    """
+    from scribe.plugins.registry import PluginRegistry
+
+    return PluginRegistry()
+
+
+def _dotted_name(node):
+    """Return 'a.b.c' for an attribute chain rooted at a plain name, else None."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+@pytest.fixture(scope="session")
+def audio_callback_attrs():
+    """Every dotted attribute access in AudioRecorder._audio_callback.
+
+    The source is parsed once per session so thread-safety checks can
+    assert on set membership instead of re-reading and scanning the file.
+    """
+    from scribe.core.audio_recorder import AudioRecorder
+
+    tree = ast.parse(textwrap.dedent(inspect.getsource(AudioRecorder._audio_callback)))
+    return frozenset(
+        name for node in ast.walk(tree)
+        if isinstance(node, ast.Attribute) and (name := _dotted_name(node))
+    )
@@ -5,20 +5,33 @@ import pytest
 from unittest.mock import MagicMock, patch
 import sys
 
+import numpy as np
+
+import sounddevice as sd
+
 # Add src to path to allow for absolute imports
 sys.path.insert(0, "src")
 
+from PyQt5.QtWidgets import QWidget
+
 from scribe.ui_fluent.setup_wizard.audio_device_page import AudioDevicePage
 from scribe.ui_fluent.setup_wizard.base_page import ValidationState
 
-@pytest.fixture
-def audio_page(qtbot, qapp):
-    """Create a fixture for the AudioDevicePage."""
-    page = AudioDevicePage()
-    qtbot.addWidget(page)
-    return page
+# Keep the whole module on one xdist worker so the module-scoped page is built once
+pytestmark = pytest.mark.xdist_group("audio_device_ui")
 
-@pytest.fixture
+
+def _reset_for_test(page):
+    """Return a shared AudioDevicePage to its freshly-constructed state.
+
+    Re-runs the constructor's device scan, which repopulates the combo and
+    re-selects the default device through the page's own signal handlers.
+    """
+    if page.level_timer.isActive():
+        page.level_timer.stop()
+    page._populate_devices()
+
+@pytest.fixture(scope="module")
 def mock_devices():
     """Provides a list of mock audio devices."""
     return [
@@ -27,18 +40,43 @@ def mock_devices():
         {'name': 'Speakers', 'max_input_channels': 0, 'index': 2},
     ]
 
+@pytest.fixture(scope="module", autouse=True)
+def _mock_sd(mock_devices):
+    """Swap in fake sounddevice queries once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sd, "query_devices", lambda *args, **kwargs: mock_devices)
+        mp.setattr(sd, "query_hostapis", lambda *args, **kwargs: [{'name': 'Mock API', 'devices': [0, 1, 2]}])
+        mp.setattr(sd, "check_input_settings", lambda *args, **kwargs: None)
+        yield
+
+@pytest.fixture(scope="module")
+def _shared_audio_page(qapp):
+    """Build the page once per module; widget construction dominates these tests."""
+    parent = QWidget()
+    page = AudioDevicePage(parent)
+    yield page
+    page.cleanup()
+    parent.deleteLater()
+
+@pytest.fixture
+def audio_page(_shared_audio_page):
+    """Provide the shared AudioDevicePage, reset before each test."""
+    _reset_for_test(_shared_audio_page)
+    return _shared_audio_page
+
 def test_initial_state(audio_page):
     """Test the initial state of the AudioDevicePage."""
-    assert audio_page.selected_device is None
+    # The scan selects the first input device but leaves it untested
+    assert audio_page.device_combo.count() == 2
+    assert audio_page.device_combo.currentIndex() == 0
+    assert audio_page.selected_device == 0
+    assert audio_page.test_button.isEnabled()
     assert not audio_page.is_recording
     assert not audio_page.device_test_passed
     assert audio_page.get_validation_state() == ValidationState.INVALID
 
-@patch('sounddevice.query_devices')
-def test_device_population(mock_query_devices, audio_page, mock_devices):
+def test_device_population(audio_page):
     """Test that the device combo box is populated correctly."""
-    mock_query_devices.return_value = mock_devices
-    
     audio_page._populate_devices()
     
     # Should only show input devices
@@ -48,52 +86,72 @@ def test_device_population(mock_query_devices, audio_page, mock_devices):
 
 def test_device_selection(audio_page, qtbot):
     """Test the behavior of selecting a device."""
-    # Manually add items to the combo box for this test
-    audio_page.device_combo.addItem("Test Mic 1", userData={'index': 0})
-    audio_page.device_combo.addItem("Test Mic 2", userData={'index': 1})
-
-    # Select the first device
+    # The scan already selected Test Mic 1; switch to the second device
     with qtbot.waitSignal(audio_page.device_combo.currentIndexChanged):
-        audio_page.device_combo.setCurrentIndex(0)
+        audio_page.device_combo.setCurrentIndex(1)
     
-    assert audio_page.selected_device is not None
+    assert audio_page.selected_device == 1
+    assert not audio_page.device_test_passed
     assert audio_page.test_button.isEnabled()
     assert audio_page.get_validation_state() == ValidationState.INVALID
 
 @patch('sounddevice.InputStream')
-def test_recording_flow(mock_input_stream, audio_page, qtbot):
+def test_recording_flow(mock_input_stream, audio_page, qtbot, monkeypatch):
     """Test the recording and validation flow."""
-    # Manually add a device and select it
-    audio_page.device_combo.addItem("Test Mic 1", userData={'index': 0})
-    audio_page.device_combo.setCurrentIndex(0)
+    # The real 3 s capture is irrelevant with a mocked stream
+    monkeypatch.setattr(audio_page, "TEST_DURATION_MS", 10)
+
+    # The reset scan leaves Test Mic 1 selected
+    assert audio_page.selected_device == 0
 
-    # Mock the audio stream to provide some data
-    mock_stream = MagicMock()
-    mock_stream.read.return_value = (MagicMock(), False) # (data, overflowed)
-    mock_input_stream.return_value.__enter__.return_value = mock_stream
+    # A healthy speech-level block; kept under 1000 samples so the
+    # spectral check (and its scipy import) is skipped
+    block = (np.random.default_rng(0).standard_normal((512, 1)) * 0.1).astype(np.float32)
 
-    # Simulate a successful recording test
-    with patch.object(audio_page, '_analyze_audio_quality', return_value=(ValidationState.VALID, "Looks good!")):
+    # The mocked stream delivers the block through the page's callback on entry
+    def open_stream(*args, callback, **kwargs):
+        stream = MagicMock()
+        stream.__enter__.side_effect = lambda: callback(block, len(block), None, None) or stream
+        return stream
+    mock_input_stream.side_effect = open_stream
+
+    # Level stats normally come from the level timer, which cannot tick
+    # while _test_recording blocks the GUI thread
+    monkeypatch.setattr(audio_page, "audio_stats", [{
+        'rms': float(np.sqrt(np.mean(block ** 2))),
+        'peak': float(np.abs(block).max()),
+        'amplitude': float(np.abs(block).mean()),
+    }], raising=False)
+
+    with qtbot.waitSignal(audio_page.analysis_finished, timeout=1000, raising=True):
         audio_page._test_recording()
-        qtbot.wait(3100) # Wait for the recording to finish
 
+    mock_input_stream.assert_called_once()
+    assert len(audio_page.audio_data) == 1
     assert audio_page.device_test_passed
     assert audio_page.get_validation_state() == ValidationState.VALID
-    assert "Looks good!" in audio_page.status_label.text()
+    assert "Test successful" in audio_page.status_label.text()
+
+@patch('sounddevice.InputStream')
+def test_recording_reentry_is_ignored(mock_input_stream, audio_page):
+    """A second _test_recording() while one is in progress must be a no-op."""
+    audio_page.is_recording = True
+
+    audio_page._test_recording()
+
+    mock_input_stream.assert_not_called()
+    assert not audio_page.level_timer.isActive()
 
-def test_audio_quality_analysis(audio_page):
+@pytest.mark.parametrize("rms, peak, amplitude, expected_state, expected_issues", [
+    (0.3, 0.99, 0.99, ValidationState.INVALID, ["Audio clipping detected"]),
+    (0.85, 0.9, 0.9, ValidationState.INVALID, ["Signal may be too hot"]),
+    (0.0005, 0.005, 0.005, ValidationState.INVALID, ["Very low audio levels detected", "Low signal strength"]),
+    (0.0005, 0.2, 0.2, ValidationState.INVALID, ["Low signal strength"]),
+    (0.005, 0.05, 0.05, ValidationState.VALID, []),  # quiet but usable microphone
+    (0.3, 0.6, 0.6, ValidationState.VALID, []),
+], ids=["clipping", "too_hot", "no_signal", "weak_signal", "quiet", "good"])
+def test_audio_quality_analysis(audio_page, rms, peak, amplitude, expected_state, expected_issues):
     """Test the audio quality analysis logic."""
-    # Test case 1: Audio levels too high (clipping)
-    state, message = audio_page._analyze_audio_quality(rms=0.8, peak=0.99)
-    assert state == ValidationState.INVALID
-    assert "too high" in message
-
-    # Test case 2: Audio levels too low
-    state, message = audio_page._analyze_audio_quality(rms=0.01, peak=0.1)
-    assert state == ValidationState.INVALID
-    assert "too low" in message
-
-    # Test case 3: Good audio levels
-    state, message = audio_page._analyze_audio_quality(rms=0.3, peak=0.6)
-    assert state == ValidationState.VALID
-    assert "working correctly" in message
\ No newline at end of file
+    state, issues = audio_page._analyze_audio_quality(rms=rms, peak=peak, amplitude=amplitude)
+    assert state == expected_state
+    assert issues == expected_issues
\ No newline at end of file
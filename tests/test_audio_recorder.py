@@ -5,6 +5,15 @@ import pytest
 import time
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
+import sounddevice as sd
+
+from scribe.core.audio_recorder import AudioBuffer, AudioRecorder
+
+
+@pytest.fixture(scope="module")
+def recorder():
+    """One idle AudioRecorder for tests that never leave it recording."""
+    return AudioRecorder(config=None)
 
 
 class TestAudioRecorderThreadSafety:
@@ -12,13 +21,10 @@ class TestAudioRecorderThreadSafety:
     
     def test_audio_recorder_imports(self):
         """Test that audio recorder can be imported."""
-        from scribe.core.audio_recorder import AudioRecorder
         assert AudioRecorder is not None
     
     def test_list_devices(self):
         """Test listing audio devices."""
-        from scribe.core.audio_recorder import AudioRecorder
-        
         devices = AudioRecorder.list_devices()
         assert isinstance(devices, list)
         # Should have at least some devices on most systems
@@ -26,8 +32,6 @@ class TestAudioRecorderThreadSafety:
     
     def test_audio_recorder_initialization(self):
         """Test audio recorder initializes without Qt application."""
-        from scribe.core.audio_recorder import AudioRecorder
-        
         # Create recorder without config
         recorder = AudioRecorder(config=None)
         assert recorder is not None
@@ -38,8 +42,6 @@ class TestAudioRecorderThreadSafety:
     @patch('scribe.core.audio_recorder.sd.InputStream')
     def test_start_recording_creates_stream(self, mock_stream_class):
         """Test that starting recording creates a stream."""
-        from scribe.core.audio_recorder import AudioRecorder
-        
         # Mock the stream
         mock_stream = MagicMock()
         mock_stream_class.return_value = mock_stream
@@ -52,28 +54,19 @@ class TestAudioRecorderThreadSafety:
         assert mock_stream.start.called
         assert recorder.is_recording == True
     
-    @patch('scribe.core.audio_recorder.sd.InputStream')
-    def test_audio_callback_doesnt_emit_signals(self, mock_stream_class):
+    def test_audio_callback_doesnt_emit_signals(self, audio_callback_attrs):
         """Test that audio callback doesn't emit Qt signals directly."""
-        from scribe.core.audio_recorder import AudioRecorder
-        import inspect
-        
-        # Check the _audio_callback source code doesn't contain .emit calls
-        source = inspect.getsource(AudioRecorder._audio_callback)
-        
         # Should NOT emit level_changed from callback (would cause segfault)
-        assert 'self.level_changed.emit' not in source, \
+        assert 'self.level_changed.emit' not in audio_callback_attrs, \
             "Audio callback must NOT emit Qt signals - causes thread-safety crash!"
         
         # Should only store the level
-        assert 'self._last_level' in source, \
+        assert 'self._last_level' in audio_callback_attrs, \
             "Audio callback should store level in _last_level for timer to emit"
     
     @patch('scribe.core.audio_recorder.sd.InputStream')
     def test_level_timer_created_on_start(self, mock_stream_class):
         """Test that QTimer is created for thread-safe signal emission."""
-        from scribe.core.audio_recorder import AudioRecorder
-        
         mock_stream = MagicMock()
         mock_stream_class.return_value = mock_stream
         
@@ -84,13 +77,9 @@ class TestAudioRecorderThreadSafety:
         assert hasattr(recorder, '_level_timer'), \
             "Should create QTimer for thread-safe level emission"
     
-    def test_device_validation(self):
+    def test_device_validation(self, recorder, monkeypatch):
         """Test that invalid device handling doesn't crash."""
-        from scribe.core.audio_recorder import AudioRecorder
-        
-        # Create recorder with invalid device
-        recorder = AudioRecorder(config=None)
-        recorder.device_id = 99999  # Invalid device
+        monkeypatch.setattr(recorder, "device_id", 99999)  # Invalid device
         
         # Should not crash when attempting to validate
         try:
@@ -103,8 +92,6 @@ class TestAudioRecorderThreadSafety:
     @patch('scribe.core.audio_recorder.sd.InputStream')
     def test_stop_recording_cleanup(self, mock_stream_class):
         """Test that stopping recording cleans up properly."""
-        from scribe.core.audio_recorder import AudioRecorder
-        
         mock_stream = MagicMock()
         mock_stream_class.return_value = mock_stream
         
@@ -112,7 +99,7 @@ class TestAudioRecorderThreadSafety:
         recorder.start_recording()
         
         # Add some fake audio data
-        recorder.audio_data = [np.zeros((1600, 1), dtype=np.int16)]
+        recorder.audio_data.append(np.zeros((1600, 1), dtype=np.int16))
         
         # Stop recording
         recorder.stop_recording()
@@ -124,20 +111,65 @@ class TestAudioRecorderThreadSafety:
         assert mock_stream.close.called
 
 
+class TestComputeLevel:
+    """Test the VU level calculation shared by recording and monitoring."""
+    
+    def test_matches_rms_definition(self):
+        """Level is RMS / int16 max with x4 gain."""
+        chunk = np.random.default_rng(0).integers(-3000, 3000, size=(1600, 1), dtype=np.int16)
+        expected = np.sqrt(np.mean(chunk.astype(np.float64) ** 2)) / np.iinfo(np.int16).max * 4.0
+        assert AudioRecorder._compute_level(chunk) == pytest.approx(expected, rel=1e-5)
+    
+    def test_clamped_and_empty(self):
+        """Loud blocks clamp to 1.0; empty blocks read as silence."""
+        assert AudioRecorder._compute_level(np.full((160, 1), 32767, dtype=np.int16)) == 1.0
+        assert AudioRecorder._compute_level(np.empty((0, 1), dtype=np.int16)) == 0.0
+
+
+class TestAudioBuffer:
+    """Test the preallocated recording buffer."""
+    
+    def test_append_is_contiguous(self):
+        """Appended chunks come back as one contiguous array in order."""
+        buffer = AudioBuffer(max_frames=10, channels=1, dtype='int16')
+        buffer.append(np.full((3, 1), 1, dtype=np.int16))
+        buffer.append(np.full((4, 1), 2, dtype=np.int16))
+        
+        assert len(buffer) == 7
+        np.testing.assert_array_equal(buffer.view()[:, 0], [1, 1, 1, 2, 2, 2, 2])
+    
+    def test_append_past_capacity_drops_excess(self):
+        """Frames beyond capacity are dropped instead of raising in the audio thread."""
+        buffer = AudioBuffer(max_frames=5, channels=1, dtype='int16')
+        buffer.append(np.ones((4, 1), dtype=np.int16))
+        buffer.append(np.ones((4, 1), dtype=np.int16))
+        
+        assert len(buffer) == 5
+    
+    def test_clear_keeps_allocation(self):
+        """Clearing empties the buffer for reuse by the next recording."""
+        buffer = AudioBuffer(max_frames=5, channels=1, dtype='int16')
+        buffer.append(np.ones((2, 1), dtype=np.int16))
+        buffer.clear()
+        
+        assert not buffer
+        assert buffer.capacity == 5
+    
+    def test_recorder_reuses_buffer(self, recorder):
+        """Preparing a new recording reuses the existing allocation."""
+        buffer = recorder.audio_data
+        assert recorder._prepare_buffer() is buffer
+
+
 class TestAudioRecorderErrorHandling:
     """Test error handling in audio recorder."""
     
     @patch('scribe.core.audio_recorder.sd.InputStream')
-    def test_portaudio_error_handling(self, mock_stream_class):
+    def test_portaudio_error_handling(self, mock_stream_class, recorder):
         """Test that PortAudioError is caught and handled."""
-        from scribe.core.audio_recorder import AudioRecorder
-        import sounddevice as sd
-        
         # Mock PortAudio error
         mock_stream_class.side_effect = sd.PortAudioError("Device busy")
         
-        recorder = AudioRecorder(config=None)
-        
         # Should not crash, should emit error signal
         error_emitted = False
         def on_error(msg):
@@ -145,7 +177,10 @@ class TestAudioRecorderErrorHandling:
             error_emitted = True
         
         recorder.error_occurred.connect(on_error)
-        recorder.start_recording()
+        try:
+            recorder.start_recording()
+        finally:
+            recorder.error_occurred.disconnect(on_error)
         
         # Should have handled error
         assert recorder.is_recording == False
@@ -153,8 +188,6 @@ class TestAudioRecorderErrorHandling:
     @patch('scribe.core.audio_recorder.sd.query_devices')
     def test_device_query_error_handling(self, mock_query):
         """Test that device query errors are handled."""
-        from scribe.core.audio_recorder import AudioRecorder
-        
         # Mock device query failure
         mock_query.side_effect = Exception("Device query failed")
         
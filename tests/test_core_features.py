@@ -5,6 +5,7 @@ Tests critical features and known issues.
 
 import sys
 import unittest
+import pytest
 from pathlib import Path
 import tempfile
 import numpy as np
@@ -44,11 +45,7 @@ class TestCoreFeatures(unittest.TestCase):
         recorder = AudioRecorder()
         recorder.start_recording()
         
-        # Record for a moment
-        import time
-        time.sleep(0.1)
-        
-        # Stop and check cleanup
+        # Stop straight away: cleanup runs the same with or without captured chunks
         audio_data = recorder.stop_recording()
         self.assertFalse(recorder.is_recording)
         # Check if stream is deleted
@@ -106,10 +103,14 @@ class TestWSLIntegration(unittest.TestCase):
         # Verify X11 setup
         self.assertTrue(manager.is_listening)
     
+    @pytest.fixture
+    def _devices(self, enumerated_devices):
+        self.devices = enumerated_devices
+    
+    @pytest.mark.usefixtures("requires_audio_hw", "_devices")
     def test_pulseaudio_detection(self):
         """Test PulseAudio device detection in WSL."""
-        recorder = AudioRecorder()
-        devices = recorder.list_devices()
+        devices = self.devices
         
         # Should find at least one device
         self.assertTrue(len(devices) > 0, "No audio devices found")
@@ -131,17 +132,18 @@ class TestWSLIntegration(unittest.TestCase):
         self.assertIsInstance(first_device['sample_rate'], int, "Sample rate should be integer")
         self.assertIsInstance(first_device['is_default'], bool, "is_default should be boolean")
 
+@pytest.mark.usefixtures("qapp")
 class TestUIComponents(unittest.TestCase):
     """Test UI component issues."""
     
-    def setUp(self):
-        from PySide6.QtWidgets import QApplication
-        self.app = QApplication.instance() or QApplication(sys.argv)
+    @pytest.fixture
+    def _devices(self, enumerated_devices):
+        self.devices = enumerated_devices
     
+    @pytest.mark.usefixtures("requires_audio_hw", "_devices")
     def test_device_selector_icons(self):
         """Test device selector combo box icons."""
-        recorder = AudioRecorder()
-        devices = recorder.list_devices()
+        devices = self.devices
         
         selector = DeviceSelector()
         
@@ -156,7 +158,7 @@ class TestUIComponents(unittest.TestCase):
     
     def test_system_tray(self):
         """Test system tray integration with fallback."""
-        from PySide6.QtWidgets import QSystemTrayIcon
+        from PyQt5.QtWidgets import QSystemTrayIcon
         
         # Test the fallback mode
         tray = QSystemTrayIcon()
@@ -2,55 +2,23 @@
 Unit tests for pattern matching with variable extraction
 """
 import pytest
-import re
-from typing import Dict, Tuple
 
+from scribe.app import (
+    _NO_PARAMS,
+    _check_jit_available,
+    _check_re2_enabled,
+    _compile_command_pattern,
+    _exact_command_words,
+    _first_matching_command,
+    _match_command_pattern,
+    pcre2,
+    re2,
+)
 
-def pattern_matches(text: str, pattern: str) -> Tuple[bool, Dict[str, str]]:
-    """Pattern matching function (copied from app.py for testing)"""
-    pattern = pattern.strip().lower()
-    text = text.strip().lower()
-    
-    if not pattern:
-        return False, {}
 
-    # Build regex with named capture groups for placeholders
-    tokens = []
-    placeholder_names = []
-    
-    for i, part in enumerate(pattern.split()):
-        if part.startswith("{") and part.endswith("}"):
-            # Extract placeholder name
-            name = part[1:-1]
-            placeholder_names.append(name)
-            
-            # Check if this is the last token - if so, match everything remaining
-            is_last = (i == len(pattern.split()) - 1)
-            
-            if is_last:
-                # Last placeholder: greedy match to end of string
-                tokens.append(rf"(?P<{name}>.+)")
-            else:
-                # Middle placeholder: non-greedy match for one or more words
-                tokens.append(rf"(?P<{name}>\S+)")
-        else:
-            # Literal text - escape special regex characters
-            tokens.append(re.escape(part))
-    
-    # Join with flexible whitespace matching
-    regex = r"\b" + r"\s+".join(tokens) + r"\b"
-    
-    # Try to match
-    match = re.search(regex, text)
-    
-    if match:
-        # Extract all named groups (parameters)
-        params = match.groupdict()
-        # Clean up parameters - strip whitespace
-        params = {k: v.strip() for k, v in params.items()}
-        return True, params
-    else:
-        return False, {}
+def pattern_matches(text: str, pattern: str):
+    """Match raw text the way ScribeApp._process_as_command normalizes it"""
+    return _match_command_pattern(text.strip().lower(), pattern)
 
 
 class TestPatternMatching:
@@ -116,6 +84,35 @@ class TestPatternMatching:
         assert matched is True
         assert params == {"app": "chrome"}
     
+    def test_literal_pattern_needs_word_boundaries(self):
+        """Test that a literal pattern found inside a longer word doesn't match"""
+        matched, params = pattern_matches("minimized", "minimize")
+        assert matched is False
+        assert params == {}
+    
+    def test_first_match_wins(self):
+        """Test that dispatch returns the first matching row in order"""
+        rows = [(p, p, c) for p, c in [("minimize", "a"), ("switch to {app}", "b"), ("switch to {app} now", "c")]]
+        assert _first_matching_command("switch to chrome now", rows) == ("switch to {app}", "b", {"app": "chrome now"})
+        assert _first_matching_command("hello world", rows) is None
+    
+    def test_exact_utterance_skips_regex(self, monkeypatch):
+        """Test that an utterance equal to a placeholder-free pattern matches without compiling"""
+        def no_regex(*args):
+            raise AssertionError("regex compiled for an exact utterance")
+        monkeypatch.setattr("scribe.app._compile_command_pattern", no_regex)
+        assert _first_matching_command("list   windows", [("List Windows", "list windows", "a")]) == ("List Windows", "a", {})
+        assert _exact_command_words("switch to {app}") is None
+        assert _exact_command_words("what's up?") is None
+    
+    def test_no_params_is_shared_and_read_only(self):
+        """Test that placeholder-free matches, exact or not, return the shared empty mapping"""
+        assert pattern_matches("minimize", "minimize")[1] is _NO_PARAMS
+        assert pattern_matches("please minimize now", "minimize")[1] is _NO_PARAMS
+        assert pattern_matches("hello", "minimize")[1] is _NO_PARAMS
+        with pytest.raises(TypeError):
+            _NO_PARAMS["app"] = "chrome"
+    
     def test_empty_pattern(self):
         """Test that empty pattern returns no match"""
         matched, params = pattern_matches("anything", "")
@@ -140,18 +137,54 @@ class TestPatternMatching:
         assert matched is False
         assert params == {}
     
+    def test_trailing_punctuation_not_captured(self):
+        """Test that sentence punctuation from transcription is left out of the last parameter"""
+        matched, params = pattern_matches("switch to visual studio code.", "switch to {app}")
+        assert matched is True
+        assert params == {"app": "visual studio code"}
+    
     def test_special_characters_in_param(self):
         """Test parameter with special characters"""
         matched, params = pattern_matches("open file-name_2.txt", "open {file}")
         assert matched is True
         assert params == {"file": "file-name_2.txt"}
     
+    def test_non_ascii_param(self):
+        """Test that accented words are captured whole"""
+        matched, params = pattern_matches("open café", "open {app}")
+        assert matched is True
+        assert params == {"app": "café"}
+    
     def test_numbers_in_param(self):
         """Test parameter with numbers"""
         matched, params = pattern_matches("switch to chrome123", "switch to {app}")
         assert matched is True
         assert params == {"app": "chrome123"}
     
+    @pytest.mark.parametrize("text,pattern,expected_match,expected_params", [
+        ("switch to visual studio code.", "switch to {app}", True, {"app": "visual studio code"}),
+        ("open café", "open {app}", True, {"app": "café"}),
+        ("open file.txt in notepad", "open {file} in {app}", True, {"file": "file.txt", "app": "notepad"}),
+        ("maximize", "minimize", False, {}),
+    ])
+    @pytest.mark.parametrize("flag,module", [
+        ("SCRIBE_USE_PCRE_JIT", pcre2),
+        ("SCRIBE_USE_RE2", re2),
+    ], ids=["pcre2_jit", "re2"])
+    def test_opt_in_engines(self, flag, module, text, pattern, expected_match, expected_params, monkeypatch):
+        """Test that the opt-in regex engines give the same results as re"""
+        if module is None:
+            pytest.skip(f"{flag} engine not installed")
+        monkeypatch.setenv(flag, "1")
+        caches = (_check_jit_available, _check_re2_enabled, _compile_command_pattern)
+        for cached in caches:
+            cached.cache_clear()
+        try:
+            assert pattern_matches(text, pattern) == (expected_match, expected_params)
+        finally:
+            for cached in caches:
+                cached.cache_clear()
+    
     @pytest.mark.parametrize("text,pattern,expected_match,expected_params", [
         # Window management commands
         ("switch to chrome", "switch to {app}", True, {"app": "chrome"}),
@@ -227,6 +227,50 @@ class TestPluginRegistry:
         registry._commands["start"][0].execute()
         assert plugin.called is True
 
+    @pytest.mark.parametrize("use_automaton", [True, False], ids=["ahocorasick", "fallback"])
+    def test_candidate_commands(self, use_automaton, monkeypatch):
+        """Test that the prefilter keeps every dispatch row that could match, in registration order"""
+        import scribe.plugins.registry as registry_module
+        if use_automaton and registry_module.ahocorasick is None:
+            pytest.skip("pyahocorasick not installed")
+        if not use_automaton:
+            monkeypatch.setattr(registry_module, "ahocorasick", None)
+        
+        class WindowPlugin(BasePlugin):
+            name = "windows"
+            version = "1.0.0"
+            
+            def commands(self):
+                return [
+                    CommandDefinition(
+                        patterns=["switch to {app}", "close {app}", "{app} please", "minimize"],
+                        handler=lambda **kwargs: None,
+                        examples=["switch to chrome"],
+                    )
+                ]
+            
+            def initialize(self, config):
+                return True
+        
+        registry = PluginRegistry()
+        registry.register_plugin(WindowPlugin())
+        
+        rows = registry.candidate_commands("Switch  To chrome")
+        patterns = [pattern for pattern, _, _ in rows]
+        if use_automaton:
+            assert patterns == ["switch to {app}", "{app} please"]
+        else:
+            assert patterns == list(registry._commands)
+        
+        # Each row carries its normalized key and the first command registered for its pattern
+        for pattern, key, command in rows:
+            assert key == pattern.strip().lower()
+            assert command is registry._commands[pattern][0]
+        
+        # Unregistering invalidates the dispatch table
+        registry.unregister_plugin("windows")
+        assert list(registry.candidate_commands("switch to chrome")) == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
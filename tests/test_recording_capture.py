@@ -8,6 +8,9 @@ import time
 
 from scribe.core.audio_recorder import AudioRecorder
 
+# Deterministic int16 chunk shared by every test instead of re-rolling per call
+_MOCK_CHUNK = np.random.default_rng(0).integers(-1000, 1000, size=(1024, 1), dtype=np.int16)
+
 @pytest.fixture
 def recorder():
     """Fixture for a clean AudioRecorder instance."""
@@ -37,8 +40,7 @@ def test_start_and_stop_recording_produces_data(recorder):
         recorder.start_recording()
         
         # Simulate audio data being added in the callback
-        test_chunk = np.random.randint(-1000, 1000, size=(1024, 1), dtype=np.int16)
-        recorder.audio_data.append(test_chunk)
+        recorder.audio_data.append(_MOCK_CHUNK)
         
         time.sleep(0.1) # Simulate a short recording
         
@@ -3,15 +3,14 @@ Integration test for audio recording - tests the actual recording flow.
 """
 import pytest
 import time
+import numpy as np
 from unittest.mock import Mock, patch, MagicMock
-from PySide6.QtCore import QTimer, QCoreApplication
-from PySide6.QtWidgets import QApplication
 
+# These open the real input device; never run them concurrently across xdist workers
+pytestmark = pytest.mark.xdist_group("audio_hw")
 
-@pytest.fixture
-def qapp(qapp):
-    """Ensure Qt application is running."""
-    return qapp
+# Deterministic int16 block standing in for one audio callback's worth of input
+_MOCK_BLOCK = np.random.default_rng(0).integers(-1000, 1000, size=(1600, 1), dtype=np.int16)
 
 
 @pytest.mark.integration
@@ -77,7 +76,6 @@ def test_recording_starts_without_crash(qapp):
 def test_recording_with_mock_stream(mock_stream_class, qapp):
     """Test recording flow with mocked audio stream."""
     from scribe.core.audio_recorder import AudioRecorder
-    import numpy as np
     
     # Setup mock stream
     mock_stream = MagicMock()
@@ -89,13 +87,17 @@ def test_recording_with_mock_stream(mock_stream_class, qapp):
     # Track signals
     signals_received = {
         'started': False,
-        'levels': [],
         'stopped': False,
         'errors': []
     }
+    level_count = 0
+    
+    def on_level(level):
+        nonlocal level_count
+        level_count += 1
     
     recorder.recording_started.connect(lambda: signals_received.__setitem__('started', True))
-    recorder.level_changed.connect(lambda level: signals_received['levels'].append(level))
+    recorder.level_changed.connect(on_level)
     recorder.recording_stopped.connect(lambda data: signals_received.__setitem__('stopped', True))
     recorder.error_occurred.connect(lambda msg: signals_received['errors'].append(msg))
     
@@ -109,15 +111,14 @@ def test_recording_with_mock_stream(mock_stream_class, qapp):
     
     # Simulate audio callback being called (from audio thread)
     # This should NOT emit signals directly
-    fake_audio = np.random.randint(-1000, 1000, (1600, 1), dtype=np.int16)
-    recorder._audio_callback(fake_audio, 1600, None, None)
+    recorder._audio_callback(_MOCK_BLOCK, 1600, None, None)
     
     # Process events to let timer emit the level signal
     time.sleep(0.1)  # Wait for timer (50ms interval)
     qapp.processEvents()
     
     # Should have level updates from timer, not from callback
-    assert len(signals_received['levels']) > 0, "Timer should emit level signals"
+    assert level_count > 0, "Timer should emit level signals"
     
     # Stop recording
     recorder.stop_recording()
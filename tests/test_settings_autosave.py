@@ -2,82 +2,163 @@
 Tests for settings auto-save functionality and model loading progress.
 """
 import pytest
-import tempfile
 import os
-from pathlib import Path
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Per-test config location, for re-instantiating ConfigManager on it."""
+    return tmp_path / "test_config.yaml"
+
+
+@pytest.fixture
+def fresh_config_manager(config_path):
+    """ConfigManager on an empty per-test config location."""
+    from scribe.config.config_manager import ConfigManager
+    
+    return ConfigManager(str(config_path))
 
 
 class TestSettingsAutoSave:
     """Test auto-save behavior for settings."""
     
-    def test_config_manager_set_and_save(self):
+    def test_config_manager_set_and_save(self, fresh_config_manager, config_path):
         """Test that ConfigManager.set() and save() work correctly."""
         from scribe.config.config_manager import ConfigManager
         
-        # Create temporary config file
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "test_config.yaml"
-            
-            # Initialize with default config
-            manager = ConfigManager(str(config_path))
-            
-            # Test setting values
-            manager.set('ui', 'theme', 'dark')
-            manager.set('whisper', 'model', 'small')
+        manager = fresh_config_manager
+        
+        # Test setting values
+        manager.set('ui', 'theme', 'dark')
+        manager.set('whisper', 'model', 'small')
+        manager.set('audio', 'sample_rate', 48000)
+        
+        # Save and verify
+        saved_path = manager.save()
+        assert saved_path.exists()
+        
+        # Reload and verify values persisted
+        manager2 = ConfigManager(str(config_path))
+        assert manager2.config.ui.theme == 'dark'
+        assert manager2.config.whisper.model == 'small'
+        assert manager2.config.audio.sample_rate == 48000
+    
+    def test_batch_saves_once(self, fresh_config_manager, config_path):
+        """Test that batch() writes once and emits config_changed once per section."""
+        from scribe.config.config_manager import ConfigManager
+        
+        manager = fresh_config_manager
+        manager.config  # create the default file before counting saves
+        changed, saves = [], []
+        manager.config_changed.connect(changed.append)
+        manager.config_saved.connect(lambda: saves.append(True))
+        
+        with manager.batch():
+            manager.set('ui', 'minimize_to_tray', True)
+            with manager.batch():
+                manager.set('ui', 'start_minimized', True)
             manager.set('audio', 'sample_rate', 48000)
-            
-            # Save and verify
-            saved_path = manager.save()
-            assert saved_path.exists()
-            
-            # Reload and verify values persisted
-            manager2 = ConfigManager(str(config_path))
-            assert manager2.config.ui.theme == 'dark'
-            assert manager2.config.whisper.model == 'small'
-            assert manager2.config.audio.sample_rate == 48000
-    
-    def test_hotkey_config_section_exists(self):
+            assert changed == [] and saves == []
+        
+        assert changed == ['ui', 'audio']
+        assert len(saves) == 1
+        
+        manager2 = ConfigManager(str(config_path))
+        assert manager2.config.ui.start_minimized is True
+        assert manager2.config.audio.sample_rate == 48000
+    
+    def test_set_unchanged_value_is_noop(self, fresh_config_manager):
+        """Test that re-setting the current value neither signals nor rewrites the file."""
+        manager = fresh_config_manager
+        theme = manager.config.ui.theme
+        changed, saves = [], []
+        manager.config_changed.connect(changed.append)
+        manager.config_saved.connect(lambda: saves.append(True))
+        
+        manager.set('ui', 'theme', theme)
+        manager.save()
+        assert changed == [] and saves == []
+        
+        manager.set('ui', 'minimize_to_tray', not manager.config.ui.minimize_to_tray)
+        manager.save()
+        assert changed == ['ui'] and len(saves) == 1
+        manager.save()
+        assert len(saves) == 1
+    
+    def test_save_after_direct_model_mutation(self, fresh_config_manager, config_path):
+        """Test that changes made on the model itself, not via set(), are saved."""
+        from scribe.config.config_manager import ConfigManager
+        
+        manager = fresh_config_manager
+        manager.config.ui.theme = 'light'
+        manager.config.plugins.plugin_config['greeter'] = {'greeting': 'hi'}
+        manager.save()
+        
+        manager2 = ConfigManager(str(config_path))
+        assert manager2.config.ui.theme == 'light'
+        assert manager2.get_plugin_config('greeter') == {'greeting': 'hi'}
+    
+    def test_set_same_object_after_in_place_change_signals(self, fresh_config_manager):
+        """Test that set() with the mutated current object is not treated as a no-op."""
+        manager = fresh_config_manager
+        changed = []
+        manager.config_changed.connect(changed.append)
+        
+        plugins = manager.config.plugins.enabled_plugins
+        plugins.append('greeter')
+        manager.set('plugins', 'enabled_plugins', plugins)
+        assert changed == ['plugins']
+    
+    def test_save_writes_utf8(self, fresh_config_manager, config_path):
+        """Test that non-ASCII values are written as UTF-8 text and reload intact."""
+        from scribe.config.config_manager import ConfigManager
+        
+        manager = fresh_config_manager
+        manager.set_plugin_config('greeter', {'greeting': 'café ☕'})
+        saved_path = manager.save()
+        
+        assert 'café ☕' in saved_path.read_text(encoding='utf-8')
+        manager2 = ConfigManager(str(config_path))
+        assert manager2.get_plugin_config('greeter') == {'greeting': 'café ☕'}
+    
+    def test_hotkey_config_section_exists(self, fresh_config_manager, config_path):
         """Test that 'hotkey' config section exists (not 'recording_options')."""
         from scribe.config.config_manager import ConfigManager
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "test_config.yaml"
-            manager = ConfigManager(str(config_path))
-            
-            # Verify hotkey section exists
-            assert hasattr(manager.config, 'hotkey')
-            assert hasattr(manager.config.hotkey, 'activation_key')
-            
-            # Test setting hotkey works (it gets normalized)
-            manager.set('hotkey', 'activation_key', 'ctrl+alt')
-            manager.save()
-            
-            # Reload and verify (hotkey may be normalized to 'alt+ctrl')
-            manager2 = ConfigManager(str(config_path))
-            # Just verify it's a valid hotkey string, normalization is OK
-            assert manager2.config.hotkey.activation_key in ['ctrl+alt', 'alt+ctrl']
-    
-    def test_language_none_handling(self):
+        manager = fresh_config_manager
+        
+        # Verify hotkey section exists
+        assert hasattr(manager.config, 'hotkey')
+        assert hasattr(manager.config.hotkey, 'activation_key')
+        
+        # Test setting hotkey works (it gets normalized)
+        manager.set('hotkey', 'activation_key', 'ctrl+alt')
+        manager.save()
+        
+        # Reload and verify (hotkey may be normalized to 'alt+ctrl')
+        manager2 = ConfigManager(str(config_path))
+        # Just verify it's a valid hotkey string, normalization is OK
+        assert manager2.config.hotkey.activation_key in ['ctrl+alt', 'alt+ctrl']
+    
+    def test_language_none_handling(self, fresh_config_manager, config_path):
         """Test that language 'auto' is saved as None."""
         from scribe.config.config_manager import ConfigManager
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "test_config.yaml"
-            manager = ConfigManager(str(config_path))
-            
-            # Test auto-detect (None)
+        manager = fresh_config_manager
+        
+        # Test auto-detect (None)
+        with manager.batch():
             manager.set('whisper', 'language', None)
-            manager.save()
-            
-            manager2 = ConfigManager(str(config_path))
-            assert manager2.config.whisper.language is None
-            
-            # Test specific language
+        
+        manager2 = ConfigManager(str(config_path))
+        assert manager2.config.whisper.language is None
+        
+        # Test specific language
+        with manager.batch():
             manager.set('whisper', 'language', 'en')
-            manager.save()
-            
-            manager3 = ConfigManager(str(config_path))
-            assert manager3.config.whisper.language == 'en'
+        
+        manager3 = ConfigManager(str(config_path))
+        assert manager3.config.whisper.language == 'en'
 
 
 class TestSystemTrayIntegration:
@@ -85,56 +166,57 @@ class TestSystemTrayIntegration:
     
     def test_tray_config_options_exist(self):
         """Test that UI config has tray-related options."""
-        from scribe.config.models import UIConfig
+        from scribe.config.models import UIConfig, default_values
         
-        # Verify UIConfig has required fields
-        config = UIConfig()
-        assert hasattr(config, 'show_system_tray')
-        assert hasattr(config, 'minimize_to_tray')
-        assert hasattr(config, 'start_minimized')
+        # One lookup covers both the field names and their defaults
+        defaults = default_values(UIConfig)
+        assert {
+            'show_system_tray': True,
+            'minimize_to_tray': False,
+            'start_minimized': False,
+        }.items() <= defaults.items()
+    
+    def test_default_values_match_fresh_instance(self):
+        """Test that cached defaults agree with a constructed config."""
+        from scribe.config.models import AppConfig, default_values
         
-        # Test default values
-        assert config.show_system_tray is True
-        assert config.minimize_to_tray is False
-        assert config.start_minimized is False
+        defaults = default_values(AppConfig)
+        assert default_values(AppConfig) is defaults
+        assert defaults['ui'] == AppConfig().ui.model_dump()
+        assert list(defaults['plugins']['enabled_plugins']) == AppConfig().plugins.enabled_plugins
+        with pytest.raises(TypeError):
+            defaults['ui']['theme'] = 'dark'
     
-    def test_tray_settings_save_and_load(self):
+    def test_tray_settings_save_and_load(self, fresh_config_manager, config_path):
         """Test that tray settings persist correctly."""
         from scribe.config.config_manager import ConfigManager
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "test_config.yaml"
-            manager = ConfigManager(str(config_path))
-            
-            # Set tray options
-            manager.set('ui', 'show_system_tray', False)
-            manager.set('ui', 'minimize_to_tray', True)
-            manager.set('ui', 'start_minimized', True)
-            manager.save()
-            
-            # Reload and verify
-            manager2 = ConfigManager(str(config_path))
-            assert manager2.config.ui.show_system_tray is False
-            assert manager2.config.ui.minimize_to_tray is True
-            assert manager2.config.ui.start_minimized is True
+        manager = fresh_config_manager
+        
+        # Set tray options
+        manager.set('ui', 'show_system_tray', False)
+        manager.set('ui', 'minimize_to_tray', True)
+        manager.set('ui', 'start_minimized', True)
+        manager.save()
+        
+        # Reload and verify
+        manager2 = ConfigManager(str(config_path))
+        assert manager2.config.ui.show_system_tray is False
+        assert manager2.config.ui.minimize_to_tray is True
+        assert manager2.config.ui.start_minimized is True
 
 
 class TestModelLoading:
     """Test model loading and download progress."""
     
-    def test_transcription_engine_config_access(self):
+    def test_transcription_engine_config_access(self, fresh_config_manager):
         """Test that TranscriptionEngine can access config."""
         from scribe.core.transcription_engine import TranscriptionEngine
-        from scribe.config.config_manager import ConfigManager
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "test_config.yaml"
-            manager = ConfigManager(str(config_path))
-            
-            # Create engine with config
-            engine = TranscriptionEngine(manager)
-            assert engine.config is not None
-            assert engine.config.config.whisper is not None
+        # Create engine with config
+        engine = TranscriptionEngine(fresh_config_manager)
+        assert engine.config is not None
+        assert engine.config.config.whisper is not None
     
     def test_model_size_options(self):
         """Test that all model sizes are valid."""
@@ -142,9 +224,13 @@ class TestModelLoading:
         
         valid_models = ['tiny', 'base', 'small', 'medium', 'large', 'large-v2', 'large-v3']
         
-        for model in valid_models:
-            config = WhisperConfig(model=model)
-            assert config.model == model
+        assert set(valid_models) <= WhisperConfig.VALID_MODELS
+        assert 'VALID_MODELS' not in WhisperConfig.model_fields
+        
+        # The set mirrors what validation actually accepts
+        assert WhisperConfig(model='large-v3').model == 'large-v3'
+        with pytest.raises(ValueError):
+            WhisperConfig(model='huge')
     
     def test_device_and_compute_type_auto(self):
         """Test that 'auto' device and compute_type are valid."""
@@ -158,17 +244,11 @@ class TestModelLoading:
 class TestExceptionLogging:
     """Test that exceptions are logged with tracebacks."""
     
-    def test_config_save_with_invalid_section_logs_error(self):
+    def test_config_save_with_invalid_section_logs_error(self, fresh_config_manager):
         """Test that invalid config section raises AttributeError."""
-        from scribe.config.config_manager import ConfigManager
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "test_config.yaml"
-            manager = ConfigManager(str(config_path))
-            
-            # Try to set invalid section (should raise AttributeError)
-            with pytest.raises(AttributeError, match="'AppConfig' object has no attribute"):
-                manager.set('invalid_section', 'some_key', 'some_value')
+        # Try to set invalid section (should raise AttributeError)
+        with pytest.raises(AttributeError, match="'AppConfig' object has no attribute"):
+            fresh_config_manager.set('invalid_section', 'some_key', 'some_value')
 
 
 class TestLogRotation:
@@ -185,31 +265,28 @@ class TestLogRotation:
         assert log_name.endswith(".log")
         assert len(timestamp) == 15  # YYYYMMDD_HHMMSS
     
-    def test_log_cleanup_keeps_recent_files(self):
+    def test_log_cleanup_keeps_recent_files(self, tmp_path):
         """Test that old log files are cleaned up."""
-        import tempfile
-        from pathlib import Path
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            
-            # Create 15 fake log files with different timestamps
-            for i in range(15):
-                log_file = log_dir / f"scribe_2025110{i:02d}_120000.log"
-                log_file.touch()
-            
-            # Get all files
-            log_files = list(log_dir.glob("scribe_*.log"))
-            assert len(log_files) == 15
-            
-            # Simulate cleanup (keep 10 most recent)
-            sorted_logs = sorted(log_files, key=lambda p: p.stat().st_mtime, reverse=True)
-            for old_log in sorted_logs[10:]:
-                old_log.unlink()
-            
-            # Verify only 10 remain
-            remaining = list(log_dir.glob("scribe_*.log"))
-            assert len(remaining) == 10
+        log_dir = tmp_path
+        
+        # Create 15 fake log files with different timestamps
+        for i in range(15):
+            log_file = log_dir / f"scribe_2025110{i:02d}_120000.log"
+            log_file.touch()
+        
+        # Get all files
+        log_files = list(log_dir.glob("scribe_*.log"))
+        assert len(log_files) == 15
+        
+        # Simulate cleanup (keep 10 most recent). The fixed-width timestamp
+        # in the name sorts chronologically, so no stat() per file is needed
+        sorted_logs = sorted(log_files, key=lambda p: p.name, reverse=True)
+        for old_log in sorted_logs[10:]:
+            old_log.unlink()
+        
+        # Verify only the 10 newest remain
+        remaining = sorted(p.name for p in log_dir.glob("scribe_*.log"))
+        assert remaining == [f"scribe_2025110{i:02d}_120000.log" for i in range(5, 15)]
 
 
 if __name__ == '__main__':
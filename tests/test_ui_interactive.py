@@ -3,15 +3,21 @@ Interactive UI Test - Manual verification of UI functionality
 
 This test opens actual UI components for manual interaction testing.
 Use this to verify buttons, navigation, and visual elements work correctly.
+
+Under pytest the windows are only opened until they are exposed, then
+closed again. Set SCRIBE_INTERACTIVE=1 (running this file directly does)
+to keep them open for a human tester.
 """
 
+import os
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication, QMessageBox
+from PyQt5.QtCore import QTimer
+from PyQt5.QtTest import QTest
 
 from scribe.analytics.value_calculator import ValueCalculator
 from scribe.config.config_manager import ConfigManager
@@ -19,7 +25,11 @@ from scribe.plugins.registry import PluginRegistry
 from scribe.ui_fluent.main_window import ScribeMainWindow
 
 
-def test_main_window_interactive():
+def _interactive() -> bool:
+    return bool(os.environ.get("SCRIBE_INTERACTIVE"))
+
+
+def test_main_window_interactive(qapp, tmp_path, plugin_registry):
     """
     Interactive test for main window functionality.
     
@@ -48,17 +58,12 @@ def test_main_window_interactive():
     print("\n✅ If all pages display correctly, UI is functional!")
     print("="*60)
     
-    app = QApplication(sys.argv)
-    
     # Create temporary config
-    import tempfile
-    temp_dir = Path(tempfile.mkdtemp())
-    config_dir = temp_dir / "config"
+    config_dir = tmp_path / "config"
     config_dir.mkdir()
     
     # Setup components
     config_manager = ConfigManager(config_dir / "test_config.yaml")
-    plugin_registry = PluginRegistry()
     value_calculator = ValueCalculator()
     
     # Add some sample data so HomePage shows something
@@ -75,6 +80,12 @@ def test_main_window_interactive():
     window = ScribeMainWindow(config_manager, plugin_registry, value_calculator)
     window.show()
     
+    if not _interactive():
+        # Smoke mode: done as soon as the window is on screen
+        assert QTest.qWaitForWindowExposed(window)
+        window.close()
+        return
+    
     # Show instructions after window appears
     def show_instructions():
         msg = QMessageBox(window)
@@ -89,29 +100,21 @@ def test_main_window_interactive():
             "• Navigation works smoothly\n\n"
             "Close this window when done testing."
         )
-        msg.setStandardButtons(QMessageBox.StandardButton.Ok)
+        msg.setStandardButtons(QMessageBox.Ok)
         msg.exec()
     
     QTimer.singleShot(500, show_instructions)
     
-    result = app.exec()
-    
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_dir)
-    
-    return result
+    return qapp.exec()
 
 
-def test_individual_pages():
+def test_individual_pages(qapp, plugin_registry):
     """Quick test of individual pages in separate windows"""
     
     print("\n" + "="*60)
     print("INDIVIDUAL PAGE TESTS")
     print("="*60)
     
-    app = QApplication(sys.argv)
-    
     from scribe.ui_fluent.pages.home import HomePage
     from scribe.ui_fluent.pages.insights import InsightsPage
     from scribe.ui_fluent.pages.plugins import PluginsPage
@@ -138,34 +141,27 @@ def test_individual_pages():
     
     # Test PluginsPage
     print("🔌 Testing PluginsPage...")
-    import tempfile
-    temp_dir = Path(tempfile.mkdtemp())
-    config_dir = temp_dir / "config"
-    config_dir.mkdir()
-    
-    config_manager = ConfigManager(config_dir / "test_config.yaml")
-    plugin_registry = PluginRegistry()
-    
-    plugins = PluginsPage(plugin_registry, config_manager)
+    plugins = PluginsPage(plugin_registry)
     plugins.setWindowTitle("Test: PluginsPage")
     plugins.resize(900, 700)
     plugins.move(0, 720)
     plugins.show()
     
+    if not _interactive():
+        for page in (home, insights, plugins):
+            assert QTest.qWaitForWindowExposed(page)
+            page.close()
+        return
+    
     print("\n✅ All pages opened. Check that content displays correctly.")
     print("   Close any window to end test.")
     
-    result = app.exec()
-    
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_dir)
-    
-    return result
+    return qapp.exec()
 
 
 if __name__ == "__main__":
     import sys
+    import tempfile
     
     print("\n🧪 SCRIBE INTERACTIVE UI TESTS")
     print("\nChoose test:")
@@ -175,13 +171,23 @@ if __name__ == "__main__":
     
     choice = input("\nEnter choice (1-3): ").strip()
     
-    if choice == "1":
-        sys.exit(test_main_window_interactive())
-    elif choice == "2":
-        sys.exit(test_individual_pages())
-    elif choice == "3":
-        test_individual_pages()
-        test_main_window_interactive()
-    else:
-        print("Invalid choice")
-        sys.exit(1)
+    os.environ.setdefault("SCRIBE_INTERACTIVE", "1")
+    app = QApplication.instance() or QApplication(sys.argv)
+    registry = PluginRegistry()
+    
+    # Outside pytest there is no tmp_path; the context manager removes the
+    # config dir even if a test raises
+    with tempfile.TemporaryDirectory() as tmp:
+        main_dir = Path(tmp)
+        if choice == "1":
+            result = test_main_window_interactive(app, main_dir, registry)
+        elif choice == "2":
+            result = test_individual_pages(app, registry)
+        elif choice == "3":
+            test_individual_pages(app, registry)
+            result = test_main_window_interactive(app, main_dir, registry)
+        else:
+            print("Invalid choice")
+            result = 1
+    
+    sys.exit(result)
@@ -1,6 +1,8 @@
 """
 Tests for UI rendering to catch issues like duplicate labels.
 """
+from collections import Counter
+
 import pytest
 from PyQt5.QtWidgets import QLabel
 from scribe.ui_fluent.pages.home import HomePage
@@ -12,14 +14,16 @@ def test_home_page_does_not_have_duplicate_labels(qtbot):
     home_page = HomePage()
     qtbot.addWidget(home_page)
 
-    # Find all QLabel widgets within the HomePage
-    labels = home_page.findChildren(QLabel)
-    
-    # Check for duplicate label text
-    label_texts = [label.text() for label in labels if label.text()]
+    # Stat values ("0", "0m", ...) may legitimately repeat, so only the
+    # captions declared in _build_labels are counted
+    texts = Counter(label.text() for label in home_page.findChildren(QLabel))
+    wrong = {
+        caption: texts[caption]
+        for caption in HomePage._build_labels().values()
+        if texts[caption] != 1
+    }
     
-    # Assert that there are no duplicate text entries
-    assert len(label_texts) == len(set(label_texts)), "Duplicate labels found on the home page"
+    assert not wrong, f"Captions not shown exactly once on the home page: {wrong!r}"
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
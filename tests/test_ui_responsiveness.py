@@ -2,62 +2,86 @@
 Tests for UI responsiveness, especially after long-running operations.
 """
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock
 from PyQt5.QtCore import QTimer
 
+import scribe.app
 from scribe.app import ScribeApp
 from scribe.core.transcription_engine import TranscriptionResult
 from scribe.ui_fluent.main_window import ScribeMainWindow
 
+
+class _Spy:
+    """Callable that just records its calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+@pytest.fixture
+def scribe_app_deps(monkeypatch):
+    """Stub the hardware/model components ScribeApp builds, for one test.
+
+    Each name gets a MagicMock instance (what patch() installs), so
+    constructing one returns a mock rather than specing a Mock class.
+    """
+    for name in ('HotkeyManager', 'TranscriptionEngine', 'AudioRecorder', 'ConfigManager'):
+        monkeypatch.setattr(scribe.app, name, MagicMock())
+
+
 # This test requires a QApplication instance to be running.
 # pytest-qt automatically handles this.
 
-def test_ui_remains_responsive_after_transcription(qtbot):
+def test_ui_remains_responsive_after_transcription(qtbot, scribe_app_deps, monkeypatch):
     """
     Test that the UI is not blocked after a transcription completes.
     """
-    with patch('scribe.app.HotkeyManager'), \
-         patch('scribe.app.TranscriptionEngine'), \
-         patch('scribe.app.AudioRecorder'), \
-         patch('scribe.app.ConfigManager'):
-
-        # Patch the method that causes blocking and is hard to test
-        with patch.object(ScribeApp, '_return_text_to_application', Mock()) as mock_paste:
-            
-            app = ScribeApp()
-            app.initialize()
-            qtbot.addWidget(app.main_window)
-
-            # Mock UI update methods to verify they are called
-            app.main_window.update_transcription_summary = Mock()
-            app.main_window.update_recording_status = Mock()
-
-            # Simulate a transcription result
-            result = TranscriptionResult(
-                text="This is a test transcription.",
-                duration=2.0,
-                confidence=0.95,
-                language="en"
-            )
-
-            # Call the transcription completion handler
-            app._on_transcription_complete(result)
-            
-            # Allow the event loop to process the deferred paste call
-            qtbot.wait(100)
-
-            # Verify the paste operation was deferred and called
-            mock_paste.assert_called_once()
-            
-            # Verify the immediate UI update was called
-            app.main_window.update_transcription_summary.assert_called_once()
-
-            # Check if the UI is still responsive by queueing another call
-            QTimer.singleShot(50, lambda: app.main_window.update_recording_status(True))
-            qtbot.wait(100)
-
-            # Verify the second UI update also happened
-            app.main_window.update_recording_status.assert_called_once_with(True)
+    # Patch the method that causes blocking and is hard to test
+    mock_paste = Mock()
+    monkeypatch.setattr(ScribeApp, '_return_text_to_application', mock_paste)
+    
+    app = ScribeApp()
+    app.initialize()
+    qtbot.addWidget(app.main_window)
+
+    # Spy on UI update methods to verify they are called
+    summary_spy = _Spy()
+    status_spy = _Spy()
+    app.main_window.update_transcription_summary = summary_spy
+    app.main_window.update_recording_status = status_spy
+
+    # Simulate a transcription result
+    result = TranscriptionResult(
+        text="This is a test transcription.",
+        duration=2.0,
+        confidence=0.95,
+        language="en"
+    )
+
+    # Text is only pasted back when the originating window was captured
+    app._current_context = {"window_handle": 1, "window_title": "Editor", "application": "editor"}
+
+    # Call the transcription completion handler
+    app._on_transcription_complete(result)
+    
+    # Allow the event loop to process the deferred paste call
+    qtbot.wait(100)
+
+    # Verify the paste operation was deferred and called
+    mock_paste.assert_called_once()
+    
+    # Verify the immediate UI update was called
+    assert len(summary_spy.calls) == 1
+
+    # Check if the UI is still responsive by queueing another call
+    QTimer.singleShot(50, lambda: app.main_window.update_recording_status(True))
+    qtbot.wait(100)
+
+    # Verify the second UI update also happened
+    assert status_spy.calls == [((True,), {})]
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -11,26 +11,22 @@ This test suite validates:
 Run with visual inspection enabled.
 """
 
+import logging
 import sys
 from pathlib import Path
 from typing import List, Dict, Any
 import time
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
 
-from PySide6.QtWidgets import QApplication, QPushButton, QMessageBox
-from PySide6.QtCore import QTimer, Qt, QRect
-from PySide6.QtTest import QTest
-from PySide6.QtGui import QPixmap
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Qt and the UI pages are imported inside the checks that use them, so
+# collecting (or deselecting) this module doesn't pay for Qt plugin loading
 from scribe.analytics.value_calculator import ValueCalculator
 from scribe.config.config_manager import ConfigManager
-from scribe.plugins.registry import PluginRegistry
-from scribe.ui_fluent.pages.home import HomePage
-from scribe.ui_fluent.pages.transcription import TranscriptionPage
-from scribe.ui_fluent.pages.plugins import PluginsPage
-from scribe.ui_fluent.pages.insights import InsightsPage
-from scribe.ui_fluent.main_window import ScribeMainWindow
+
+logger = logging.getLogger(__name__)
 
 
 class VisualTestResults:
@@ -41,117 +37,181 @@ class VisualTestResults:
         self.warnings = []
         self.placeholders_found = []
         
+    # Per-check progress goes through logging so it stays quiet (and
+    # unencoded) unless a handler asks for it; print_summary() is the report
     def add_pass(self, test_name, details=""):
         self.passed.append((test_name, details))
-        print(f"✅ PASS: {test_name}")
-        if details:
-            print(f"   → {details}")
+        logger.info("PASS: %s%s", test_name, f" - {details}" if details else "")
         
     def add_fail(self, test_name, error):
         self.failed.append((test_name, error))
-        print(f"❌ FAIL: {test_name}")
-        print(f"   → {error}")
+        logger.error("FAIL: %s - %s", test_name, error)
         
     def add_warning(self, test_name, warning):
         self.warnings.append((test_name, warning))
-        print(f"⚠️  WARN: {test_name}")
-        print(f"   → {warning}")
+        logger.warning("WARN: %s - %s", test_name, warning)
         
     def add_placeholder(self, location, description):
         self.placeholders_found.append((location, description))
-        print(f"🔍 PLACEHOLDER: {location}")
-        print(f"   → {description}")
+        logger.info("PLACEHOLDER: %s - %s", location, description)
         
     def print_summary(self):
-        print("\n" + "="*70)
-        print("VISUAL & FUNCTIONAL VALIDATION RESULTS")
-        print("="*70)
-        print(f"✅ Passed:       {len(self.passed)}")
-        print(f"❌ Failed:       {len(self.failed)}")
-        print(f"⚠️  Warnings:     {len(self.warnings)}")
-        print(f"🔍 Placeholders: {len(self.placeholders_found)}")
-        print("="*70)
+        # Assembled first and written in one go rather than line by line
+        lines = [
+            "",
+            "="*70,
+            "VISUAL & FUNCTIONAL VALIDATION RESULTS",
+            "="*70,
+            f"✅ Passed:       {len(self.passed)}",
+            f"❌ Failed:       {len(self.failed)}",
+            f"⚠️  Warnings:     {len(self.warnings)}",
+            f"🔍 Placeholders: {len(self.placeholders_found)}",
+            "="*70,
+        ]
         
         if self.placeholders_found:
-            print("\n📋 PLACEHOLDERS TO FIX:")
+            lines.append("\n📋 PLACEHOLDERS TO FIX:")
             for i, (loc, desc) in enumerate(self.placeholders_found, 1):
-                print(f"{i}. {loc}")
-                print(f"   {desc}")
+                lines.append(f"{i}. {loc}")
+                lines.append(f"   {desc}")
         
         if self.failed:
-            print("\n❌ FAILED TESTS:")
+            lines.append("\n❌ FAILED TESTS:")
             for test_name, error in self.failed:
-                print(f"  - {test_name}: {error}")
+                lines.append(f"  - {test_name}: {error}")
         
         if self.warnings:
-            print("\n⚠️  WARNINGS:")
+            lines.append("\n⚠️  WARNINGS:")
             for test_name, warning in self.warnings:
-                print(f"  - {test_name}: {warning}")
+                lines.append(f"  - {test_name}: {warning}")
+        
+        print("\n".join(lines))
+
+
+@pytest.fixture(scope="session")
+def results_collector(pytestconfig):
+    """One VisualTestResults shared by every check, summarised at session end."""
+    results = VisualTestResults()
+    pytestconfig.visual_results = results  # Read back by run_visual_validation_suite()
+    yield results
+    results.print_summary()
+
+
+@pytest.fixture(scope="module")
+def rich_calc():
+    """ValueCalculator with 10 transcriptions and 5 commands; tests only read it."""
+    calc = ValueCalculator()
+    for _ in range(10):
+        calc.record_transcription(6.0, 90, 1.5, 0.3, 1)
+    for _ in range(5):
+        calc.record_command("test", "plugin", 0.2, True)
+    return calc
+
+
+def _count_overlaps(rects) -> int:
+    """Count intersecting pairs among (x, y, w, h) rects with a sweep over x.
+
+    Same half-open edges as QRect.intersects for non-empty rects; only rects
+    whose x-span is still open are compared on y.
+    """
+    overlaps = 0
+    active = []
+    for x, y, w, h in sorted(rects):
+        active = [r for r in active if r[0] + r[2] > x]
+        overlaps += sum(1 for _, ay, _, ah in active if ay < y + h and ay + ah > y)
+        active.append((x, y, w, h))
+    return overlaps
+
+
+def _assert_no_new_failures(results: VisualTestResults, failures_before: int) -> None:
+    """Fail the calling test if it recorded any failed checks.
+
+    The collector only feeds the end-of-session summary; each test still has
+    to fail on its own checks.
+    """
+    new_failures = results.failed[failures_before:]
+    if new_failures:
+        # pytest.fail, not assert: the tests' `except Exception` must not swallow it
+        pytest.fail("; ".join(f"{name}: {error}" for name, error in new_failures))
+
 
+def _wait_for(qtbot, predicate, timeout: int) -> None:
+    """Wait until predicate() holds or timeout (ms) passes.
 
-def test_home_page_visual(results: VisualTestResults):
+    A timeout is not an error here: the check that follows records the
+    outcome in the results.
+    """
+    try:
+        qtbot.waitUntil(lambda: bool(predicate()), timeout=timeout)
+    except qtbot.TimeoutError:
+        pass
+
+
+def test_home_page_visual(qtbot, results_collector: VisualTestResults, rich_calc):
     """Test HomePage visual elements and data display"""
-    print("\n" + "="*70)
-    print("TESTING: HomePage Visual & Functional")
-    print("="*70)
+    logger.info("TESTING: HomePage Visual & Functional")
+    failures_before = len(results_collector.failed)
+    
+    pytest.importorskip("qfluentwidgets")
+    from PyQt5.QtWidgets import QPushButton
+    from scribe.ui_fluent.pages.home import HomePage
     
     try:
-        app = QApplication.instance() or QApplication(sys.argv)
-        
-        # Create with sample data
-        calc = ValueCalculator()
-        calc.record_transcription(5.0, 100, 1.5, 0.3, 2)
-        calc.record_command("test", "test_plugin", 0.3, True)
-        
+        calc = rich_calc
         home = HomePage(calc)
-        home.show()
-        QTest.qWait(100)
+        with qtbot.waitExposed(home):
+            home.show()
         
         # Check window properties
         if home.isVisible():
-            results.add_pass("HomePage Visibility", "Window is visible")
+            results_collector.add_pass("HomePage Visibility", "Window is visible")
         else:
-            results.add_fail("HomePage Visibility", "Window not visible")
+            results_collector.add_fail("HomePage Visibility", "Window not visible")
         
         # Check metrics are displayed with actual data
         summary = calc.get_session_summary()
         if summary.total_words > 0:
-            results.add_pass("HomePage Data", f"Shows {summary.total_words} words")
+            results_collector.add_pass("HomePage Data", f"Shows {summary.total_words} words")
         else:
-            results.add_fail("HomePage Data", "No data displayed")
+            results_collector.add_fail("HomePage Data", "No data displayed")
         
         # Check for interactive elements
         buttons = home.findChildren(QPushButton)
         if len(buttons) > 0:
-            results.add_pass("HomePage Buttons", f"Found {len(buttons)} buttons")
+            results_collector.add_pass("HomePage Buttons", f"Found {len(buttons)} buttons")
             
-            # Test button clicks
+            # Test button clicks; connected slots run synchronously on emit,
+            # so there is no event loop to spin
             for btn in buttons[:3]:  # Test first 3 buttons
                 if btn.isEnabled():
-                    QTest.mouseClick(btn, Qt.MouseButton.LeftButton)
-                    QTest.qWait(50)
-                    results.add_pass("Button Click", f"'{btn.text()}' clickable")
+                    btn.clicked.emit()
+                    results_collector.add_pass("Button Click", f"'{btn.text()}' clickable")
         else:
-            results.add_warning("HomePage Buttons", "No buttons found")
+            results_collector.add_warning("HomePage Buttons", "No buttons found")
         
         home.close()
         
     except Exception as e:
-        results.add_fail("HomePage Visual Test", str(e))
+        results_collector.add_fail("HomePage Visual Test", str(e))
+    
+    _assert_no_new_failures(results_collector, failures_before)
 
 
-def test_transcription_page_functional(results: VisualTestResults):
+def test_transcription_page_functional(qtbot, results_collector: VisualTestResults):
     """Test TranscriptionPage button interactions"""
-    print("\n" + "="*70)
-    print("TESTING: TranscriptionPage Functional")
-    print("="*70)
+    logger.info("TESTING: TranscriptionPage Functional")
+    failures_before = len(results_collector.failed)
+    
+    pytest.importorskip("qfluentwidgets")
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtTest import QTest
+    from PyQt5.QtWidgets import QPushButton
+    from scribe.ui_fluent.pages.transcription import TranscriptionPage
     
     try:
-        app = QApplication.instance() or QApplication(sys.argv)
-        
         page = TranscriptionPage()
-        page.show()
-        QTest.qWait(100)
+        with qtbot.waitExposed(page):
+            page.show()
         
         # Find record button
         record_btn = None
@@ -161,44 +221,47 @@ def test_transcription_page_functional(results: VisualTestResults):
                 break
         
         if not record_btn:
-            results.add_fail("Transcription Button", "Record button not found")
+            results_collector.add_fail("Transcription Button", "Record button not found")
             page.close()
+            _assert_no_new_failures(results_collector, failures_before)
             return
         
-        results.add_pass("Transcription Button", "Found record button")
+        results_collector.add_pass("Transcription Button", "Found record button")
         
         # Test recording toggle
         initial_text = record_btn.text()
         QTest.mouseClick(record_btn, Qt.MouseButton.LeftButton)
-        QTest.qWait(100)
+        _wait_for(qtbot, lambda: record_btn.text() != initial_text, timeout=500)
         
         if record_btn.text() != initial_text:
-            results.add_pass("Recording Toggle", f"Button changed: {initial_text} → {record_btn.text()}")
+            results_collector.add_pass("Recording Toggle", f"Button changed: {initial_text} → {record_btn.text()}")
         else:
-            results.add_fail("Recording Toggle", "Button text didn't change")
+            results_collector.add_fail("Recording Toggle", "Button text didn't change")
         
         # Check if status updates
         if hasattr(page, 'status_label'):
             status_text = page.status_label.text()
             if "Recording" in status_text or "Processing" in status_text:
-                results.add_pass("Status Update", f"Status: {status_text}")
+                results_collector.add_pass("Status Update", f"Status: {status_text}")
             else:
-                results.add_warning("Status Update", f"Unexpected status: {status_text}")
+                results_collector.add_warning("Status Update", f"Unexpected status: {status_text}")
         
         # Stop recording
         QTest.mouseClick(record_btn, Qt.MouseButton.LeftButton)
-        QTest.qWait(1500)  # Wait for simulated transcription
+        if hasattr(page, 'output_text'):
+            # Simulated transcription lands within ~1.5s
+            _wait_for(qtbot, page.output_text.toPlainText, timeout=1500)
         
         # Check if text appears in output
         if hasattr(page, 'output_text'):
             output = page.output_text.toPlainText()
             if output and len(output) > 0:
-                results.add_pass("Transcription Output", f"Text appeared: '{output[:50]}...'")
+                results_collector.add_pass("Transcription Output", f"Text appeared: '{output[:50]}...'")
             else:
-                results.add_warning("Transcription Output", "No text appeared")
+                results_collector.add_warning("Transcription Output", "No text appeared")
         
         # Check for placeholder functionality
-        results.add_placeholder(
+        results_collector.add_placeholder(
             "TranscriptionPage._show_result()",
             "Uses simulated text instead of real transcription"
         )
@@ -206,37 +269,32 @@ def test_transcription_page_functional(results: VisualTestResults):
         page.close()
         
     except Exception as e:
-        results.add_fail("TranscriptionPage Functional Test", str(e))
+        results_collector.add_fail("TranscriptionPage Functional Test", str(e))
+    
+    _assert_no_new_failures(results_collector, failures_before)
 
 
-def test_plugins_page_interaction(results: VisualTestResults):
+def test_plugins_page_interaction(qtbot, results_collector: VisualTestResults, plugin_registry):
     """Test PluginsPage toggle switches and configuration"""
-    print("\n" + "="*70)
-    print("TESTING: PluginsPage Interaction")
-    print("="*70)
+    logger.info("TESTING: PluginsPage Interaction")
+    failures_before = len(results_collector.failed)
+    
+    pytest.importorskip("qfluentwidgets")
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtTest import QTest
+    from scribe.ui_fluent.pages.plugins import PluginsPage
     
     try:
-        app = QApplication.instance() or QApplication(sys.argv)
-        
-        import tempfile
-        temp_dir = Path(tempfile.mkdtemp())
-        config_dir = temp_dir / "config"
-        config_dir.mkdir()
-        
-        config = ConfigManager(config_dir / "test.yaml")
-        registry = PluginRegistry()
-        
-        # Since registry is empty, pass None to trigger sample plugins
-        page = PluginsPage(None, config)
-        page.show()
-        QTest.qWait(200)
+        page = PluginsPage(plugin_registry)
+        with qtbot.waitExposed(page):
+            page.show()
         
         # Check for plugin cards
         from scribe.ui_fluent.widgets.plugin_card import PluginCard
         cards = page.findChildren(PluginCard)
         
         if len(cards) > 0:
-            results.add_pass("Plugin Cards", f"Found {len(cards)} plugin cards")
+            results_collector.add_pass("Plugin Cards", f"Found {len(cards)} plugin cards")
             
             # Test toggle switches
             for i, card in enumerate(cards[:2]):  # Test first 2
@@ -244,114 +302,105 @@ def test_plugins_page_interaction(results: VisualTestResults):
                 
                 # Toggle the switch
                 card.toggle.setChecked(not initial_state)
-                QTest.qWait(50)
+                _wait_for(qtbot, lambda: card.toggle.isChecked() != initial_state, timeout=500)
                 
                 new_state = card.toggle.isChecked()
                 if new_state != initial_state:
-                    results.add_pass("Toggle Switch", f"Card {i+1} toggled: {initial_state} → {new_state}")
+                    results_collector.add_pass("Toggle Switch", f"Card {i+1} toggled: {initial_state} → {new_state}")
                 else:
-                    results.add_warning("Toggle Switch", f"Card {i+1} state didn't change")
+                    results_collector.add_warning("Toggle Switch", f"Card {i+1} state didn't change")
                 
                 # Test configure button
                 if hasattr(card, 'config_btn'):
                     QTest.mouseClick(card.config_btn, Qt.MouseButton.LeftButton)
-                    QTest.qWait(100)
-                    results.add_pass("Configure Button", f"Card {i+1} config button clicked")
+                    results_collector.add_pass("Configure Button", f"Card {i+1} config button clicked")
         else:
-            results.add_fail("Plugin Cards", "No plugin cards found")
+            results_collector.add_fail("Plugin Cards", "No plugin cards found")
         
         # Check for placeholders
-        results.add_placeholder(
+        results_collector.add_placeholder(
             "PluginsPage._on_plugin_toggled()",
             "TODO: Hot reload plugin - needs implementation"
         )
         
-        results.add_placeholder(
+        results_collector.add_placeholder(
             "PluginsPage._on_plugin_configure()",
             "TODO: Open plugin settings dialog - shows placeholder message"
         )
         
         page.close()
         
-        import shutil
-        shutil.rmtree(temp_dir)
-        
     except Exception as e:
-        results.add_fail("PluginsPage Interaction Test", str(e))
+        results_collector.add_fail("PluginsPage Interaction Test", str(e))
+    
+    _assert_no_new_failures(results_collector, failures_before)
 
 
-def test_insights_page_data(results: VisualTestResults):
+def test_insights_page_data(qtbot, results_collector: VisualTestResults, rich_calc):
     """Test InsightsPage displays insights correctly"""
-    print("\n" + "="*70)
-    print("TESTING: InsightsPage Data Display")
-    print("="*70)
+    logger.info("TESTING: InsightsPage Data Display")
+    failures_before = len(results_collector.failed)
+    
+    pytest.importorskip("qfluentwidgets")
+    from scribe.ui_fluent.pages.insights import InsightsPage
     
     try:
-        app = QApplication.instance() or QApplication(sys.argv)
-        
-        # Create calculator with substantial data
-        calc = ValueCalculator()
-        for _ in range(10):
-            calc.record_transcription(6.0, 90, 1.5, 0.3, 1)
-        for _ in range(5):
-            calc.record_command("test", "plugin", 0.2, True)
-        
+        calc = rich_calc
         page = InsightsPage(calc)
-        page.show()
-        QTest.qWait(100)
+        with qtbot.waitExposed(page):
+            page.show()
         
         # Check if insights were generated
         from scribe.ui_fluent.widgets.insight_card import InsightCard
         insight_cards = page.findChildren(InsightCard)
         
         if len(insight_cards) > 0:
-            results.add_pass("Insight Cards", f"Found {len(insight_cards)} insights")
+            results_collector.add_pass("Insight Cards", f"Found {len(insight_cards)} insights")
             
             # Check insight content
             for i, card in enumerate(insight_cards[:3]):
                 if hasattr(card, 'value_label'):
                     value = card.value_label.text()
                     if value and value != "No data yet":
-                        results.add_pass("Insight Data", f"Card {i+1}: {value}")
+                        results_collector.add_pass("Insight Data", f"Card {i+1}: {value}")
                     else:
-                        results.add_warning("Insight Data", f"Card {i+1} has no data")
+                        results_collector.add_warning("Insight Data", f"Card {i+1} has no data")
         else:
-            results.add_fail("Insight Cards", "No insight cards found")
+            results_collector.add_fail("Insight Cards", "No insight cards found")
         
         # Verify real data vs sample data
         summary = calc.get_session_summary()
         if summary.total_words == 900:  # 10 * 90 words
-            results.add_pass("Insight Calculation", "Using real calculator data")
+            results_collector.add_pass("Insight Calculation", "Using real calculator data")
         else:
-            results.add_warning("Insight Calculation", "May not be using real data")
+            results_collector.add_warning("Insight Calculation", "May not be using real data")
         
         page.close()
         
     except Exception as e:
-        results.add_fail("InsightsPage Data Test", str(e))
+        results_collector.add_fail("InsightsPage Data Test", str(e))
+    
+    _assert_no_new_failures(results_collector, failures_before)
 
 
-def test_main_window_navigation(results: VisualTestResults):
+def test_main_window_navigation(qtbot, results_collector: VisualTestResults, tmp_path, plugin_registry):
     """Test MainWindow page navigation"""
-    print("\n" + "="*70)
-    print("TESTING: MainWindow Navigation")
-    print("="*70)
+    logger.info("TESTING: MainWindow Navigation")
+    failures_before = len(results_collector.failed)
+    
+    pytest.importorskip("qfluentwidgets")
+    from scribe.ui_fluent.main_window import ScribeMainWindow
     
     try:
-        app = QApplication.instance() or QApplication(sys.argv)
-        
-        import tempfile
-        temp_dir = Path(tempfile.mkdtemp())
-        config_dir = temp_dir / "config"
+        config_dir = tmp_path / "config"
         config_dir.mkdir()
         
         config = ConfigManager(config_dir / "test.yaml")
-        registry = PluginRegistry()
         calc = ValueCalculator()
         
-        window = ScribeMainWindow(config, registry, calc)
-        window.show()
-        QTest.qWait(200)
+        window = ScribeMainWindow(config, plugin_registry, calc)
+        with qtbot.waitExposed(window):
+            window.show()
         
         # Test that all pages exist
         pages_to_test = [
@@ -363,98 +412,92 @@ def test_main_window_navigation(results: VisualTestResults):
             ('about_page', 'About')
         ]
         
+        # Index the navigation stack once instead of scanning it per page
+        stack = getattr(window, 'stackedWidget', None)
+        index_of = {stack.widget(i): i for i in range(stack.count())} if stack else {}
+        
         for page_attr, page_name in pages_to_test:
-            if hasattr(window, page_attr):
-                page = getattr(window, page_attr)
-                results.add_pass("Page Existence", f"{page_name} page exists")
+            page = getattr(window, page_attr, None)
+            if page is None:
+                results_collector.add_fail("Page Existence", f"{page_name} page not found")
+                continue
+            results_collector.add_pass("Page Existence", f"{page_name} page exists")
+            
+            # Check page has been added to stack
+            if stack is None:
+                continue
+            page_index = index_of.get(page, -1)
+            
+            if page_index >= 0:
+                results_collector.add_pass("Page Navigation", f"{page_name} in navigation stack")
                 
-                # Check page has been added to stack
-                if hasattr(window, 'stackedWidget'):
-                    stack = window.stackedWidget
-                    page_index = -1
-                    for i in range(stack.count()):
-                        if stack.widget(i) == page:
-                            page_index = i
-                            break
-                    
-                    if page_index >= 0:
-                        results.add_pass("Page Navigation", f"{page_name} in navigation stack")
-                        
-                        # Try to switch to it
-                        stack.setCurrentIndex(page_index)
-                        QTest.qWait(50)
-                        
-                        if stack.currentWidget() == page:
-                            results.add_pass("Page Switch", f"Successfully switched to {page_name}")
-                        else:
-                            results.add_warning("Page Switch", f"Switch to {page_name} unclear")
-                    else:
-                        results.add_warning("Page Navigation", f"{page_name} not in navigation")
+                # Try to switch to it
+                stack.setCurrentIndex(page_index)
+                _wait_for(qtbot, lambda: stack.currentWidget() == page, timeout=500)
+                
+                if stack.currentWidget() == page:
+                    results_collector.add_pass("Page Switch", f"Successfully switched to {page_name}")
+                else:
+                    results_collector.add_warning("Page Switch", f"Switch to {page_name} unclear")
             else:
-                results.add_fail("Page Existence", f"{page_name} page not found")
+                results_collector.add_warning("Page Navigation", f"{page_name} not in navigation")
         
         window.close()
         
-        import shutil
-        shutil.rmtree(temp_dir)
-        
     except Exception as e:
-        results.add_fail("MainWindow Navigation Test", str(e))
+        results_collector.add_fail("MainWindow Navigation Test", str(e))
+    
+    _assert_no_new_failures(results_collector, failures_before)
 
 
-def test_widget_sizing_and_layout(results: VisualTestResults):
+def test_widget_sizing_and_layout(qtbot, results_collector: VisualTestResults, rich_calc):
     """Test that widgets are properly sized and don't overlap"""
-    print("\n" + "="*70)
-    print("TESTING: Widget Sizing and Layout")
-    print("="*70)
+    logger.info("TESTING: Widget Sizing and Layout")
+    failures_before = len(results_collector.failed)
+    
+    pytest.importorskip("qfluentwidgets")
+    from scribe.ui_fluent.pages.home import HomePage
     
     try:
-        app = QApplication.instance() or QApplication(sys.argv)
-        
-        calc = ValueCalculator()
-        home = HomePage(calc)
+        home = HomePage(rich_calc)
         home.resize(900, 700)
-        home.show()
-        QTest.qWait(100)
+        with qtbot.waitExposed(home):
+            home.show()
         
         # Check window size
         geometry = home.geometry()
         if geometry.width() >= 800 and geometry.height() >= 600:
-            results.add_pass("Window Size", f"{geometry.width()}x{geometry.height()}")
+            results_collector.add_pass("Window Size", f"{geometry.width()}x{geometry.height()}")
         else:
-            results.add_warning("Window Size", f"Small: {geometry.width()}x{geometry.height()}")
+            results_collector.add_warning("Window Size", f"Small: {geometry.width()}x{geometry.height()}")
         
         # Check for overlapping widgets
         from scribe.ui_fluent.widgets.value_card import ValueCard
         cards = home.findChildren(ValueCard)
         
         if len(cards) >= 2:
-            rects = [card.geometry() for card in cards]
-            overlaps = []
-            
-            for i, rect1 in enumerate(rects):
-                for j, rect2 in enumerate(rects[i+1:], i+1):
-                    if rect1.intersects(rect2):
-                        overlaps.append((i, j))
+            overlaps = _count_overlaps(card.geometry().getRect() for card in cards)
             
             if not overlaps:
-                results.add_pass("Layout Check", "No widget overlaps detected")
+                results_collector.add_pass("Layout Check", "No widget overlaps detected")
             else:
-                results.add_warning("Layout Check", f"Found {len(overlaps)} overlapping widgets")
+                results_collector.add_warning("Layout Check", f"Found {overlaps} overlapping widgets")
         
         # Check text readability (not truncated)
         for card in cards[:3]:
             if hasattr(card, 'title_label'):
                 text = card.title_label.text()
                 if len(text) > 0 and not text.endswith('...'):
-                    results.add_pass("Text Display", f"'{text}' fully visible")
+                    results_collector.add_pass("Text Display", f"'{text}' fully visible")
                 else:
-                    results.add_warning("Text Display", f"'{text}' may be truncated")
+                    results_collector.add_warning("Text Display", f"'{text}' may be truncated")
         
         home.close()
         
     except Exception as e:
-        results.add_fail("Widget Sizing Test", str(e))
+        results_collector.add_fail("Widget Sizing Test", str(e))
+    
+    _assert_no_new_failures(results_collector, failures_before)
 
 
 def run_visual_validation_suite():
@@ -470,22 +513,22 @@ def run_visual_validation_suite():
     print("  • Placeholder identification")
     print("\n")
     
-    results = VisualTestResults()
-    
-    # Run all tests
-    test_home_page_visual(results)
-    test_transcription_page_functional(results)
-    test_plugins_page_interaction(results)
-    test_insights_page_data(results)
-    test_main_window_navigation(results)
-    test_widget_sizing_and_layout(results)
-    
-    # Print summary
-    results.print_summary()
+    # The checks need qtbot and the shared fixtures, so run them via pytest;
+    # results_collector prints the summary when the session ends
+    class _Outcome:
+        results = None
+        
+        def pytest_unconfigure(self, config):
+            self.results = getattr(config, "visual_results", None)
     
-    return len(results.failed) == 0
+    outcome = _Outcome()
+    exit_code = pytest.main([__file__, "-s", "-p", "no:cacheprovider"], plugins=[outcome])
+    return exit_code == 0 and not (outcome.results and outcome.results.failed)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
+    if "-v" in sys.argv:
+        logger.setLevel(logging.INFO)
     success = run_visual_validation_suite()
     sys.exit(0 if success else 1)
@@ -1,12 +1,19 @@
+from functools import lru_cache
+
 import sounddevice as sd
 
+@lru_cache(maxsize=1)
+def _devices():
+    # One PortAudio enumeration per process; _devices.cache_clear() to rescan
+    return sd.query_devices()
+
 def list_devices():
     print("Available Audio Devices:")
     print("-" * 60)
     print(f"{'ID':<4} {'Name':<40} {'Channels':<10} {'Sample Rate'}")
     print("-" * 60)
     
-    devices = sd.query_devices()
+    devices = _devices()
     for i, device in enumerate(devices):
         # Filter for input devices (microphones)
         if device['max_input_channels'] > 0:
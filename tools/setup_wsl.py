@@ -46,12 +46,20 @@ def check_packages() -> Dict[str, bool]:
         'x11-xserver-utils': False
     }
     
-    for pkg in packages:
-        try:
-            result = run_command(['dpkg', '-s', pkg], check=False)
-            packages[pkg] = result and result.returncode == 0
-        except:
-            pass
+    # One dpkg-query for all packages; unknown ones only show up on stderr
+    # and keep their False default
+    try:
+        result = run_command(
+            ['dpkg-query', '-W', '-f=${Package} ${db:Status-Status}\n'] + list(packages),
+            check=False
+        )
+        if result:
+            for line in result.stdout.splitlines():
+                pkg, _, status = line.partition(' ')
+                if pkg in packages:
+                    packages[pkg] = packages[pkg] or status.strip() == 'installed'
+    except:
+        pass
             
     return packages
 
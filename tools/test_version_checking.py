@@ -3,12 +3,23 @@
 Test script for build timestamp and version checking.
 
 This simulates different scenarios to verify the single instance manager works correctly.
+Run it directly for a printed report, or under pytest (optionally in parallel):
+
+    pytest tools/test_version_checking.py -n auto
 """
 
 import sys
 import time
-import tempfile
+from contextlib import nullcontext
 from pathlib import Path
+from unittest import mock
+
+import pytest
+
+try:
+    from filelock import FileLock
+except ImportError:  # optional; the manager works without it too
+    FileLock = None
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -16,85 +27,100 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from scribe.core.single_instance import SingleInstanceManager
 
 
-def test_scenario(scenario_name, current_version, current_build, new_version, new_build, expected_result):
-    """Test a specific scenario."""
-    print(f"\n{'='*70}")
-    print(f"Scenario: {scenario_name}")
-    print(f"{'='*70}")
-    print(f"Current instance: v{current_version} (build {current_build})")
-    print(f"New instance:     v{new_version} (build {new_build})")
-    print(f"Expected:         {expected_result}")
-    print()
-    
-    # Create a mock lock file
-    lock_file = Path(tempfile.gettempdir()) / ".scribe_test.lock"
-    
-    # Write mock current instance
-    lock_file.write_text(f"99999|{current_version}|{current_build}")
+# (name, current_v, current_build, new_v, new_build, should_acquire)
+SCENARIOS = [
+    ("Newer version (any build)", "2.0.0", 1000, "2.0.1", 1000, True),
+    ("Older version (any build)", "2.0.1", 1000, "2.0.0", 1000, False),
+    ("Same version, newer build", "2.0.1", 1000, "2.0.1", 2000, True),
+    ("Same version, older build", "2.0.1", 2000, "2.0.1", 1000, False),
+    ("Same version and build", "2.0.1", 1000, "2.0.1", 1000, False),
+]
+
+
+def run_scenario(scenario_name, current_version, current_build, new_version, new_build, expected_result,
+                 lock_file=None):
+    """Run a specific scenario and return whether the new instance acquired the lock.
+
+    ``lock_file`` overrides the manager's default lock path so that
+    concurrent runs (e.g. pytest-xdist workers) do not share one file.
+    """
+    out = [
+        f"\n{'='*70}",
+        f"Scenario: {scenario_name}",
+        f"{'='*70}",
+        f"Current instance: v{current_version} (build {current_build})",
+        f"New instance:     v{new_version} (build {new_build})",
+        f"Expected:         {expected_result}",
+        "",
+    ]
+    # Header goes out before acquire(), which prints its own messages
+    sys.stdout.write("\n".join(out) + "\n")
     
-    # Try to acquire with new instance
+    # The new instance; its own lock path is where the mock current instance goes
     manager = SingleInstanceManager("scribe_test", new_version, new_build)
+    if lock_file is not None:
+        manager.lock_file = lock_file
+    lock_file = manager.lock_file
     
-    # Override is_process_running to always return True (simulating running process)
-    original_check = manager._is_process_running
-    manager._is_process_running = lambda pid: True
-    
-    result = manager.acquire()
-    
-    # Restore and cleanup
-    manager._is_process_running = original_check
-    if lock_file.exists():
-        lock_file.unlink()
+    try:
+        # Write mock current instance under the same guard acquire() takes
+        with FileLock(f"{lock_file}.lock") if FileLock else nullcontext():
+            lock_file.write_text(f"99999|{current_version}|{current_build}")
+        
+        # Pretend the recorded process is still running
+        with mock.patch.object(manager, '_is_process_running', return_value=True):
+            result = manager.acquire()
+    finally:
+        # Never leave a lock behind for the next scenario
+        lock_file.unlink(missing_ok=True)
     
     if result:
-        print("✅ Result: Acquired (would start new instance)")
+        sys.stdout.write("✅ Result: Acquired (would start new instance)\n")
     else:
-        print("❌ Result: Denied (would show warning)")
+        sys.stdout.write("❌ Result: Denied (would show warning)\n")
     
     return result
 
 
+@pytest.mark.parametrize(
+    "current_version,current_build,new_version,new_build,expected",
+    [scenario[1:] for scenario in SCENARIOS],
+    ids=[scenario[0] for scenario in SCENARIOS],
+)
+def test_scenario(request, tmp_path, current_version, current_build, new_version, new_build, expected):
+    """Each scenario gets its own lock under tmp_path, which is already unique per test and per worker."""
+    result = run_scenario(request.node.callspec.id, current_version, current_build,
+                          new_version, new_build, expected,
+                          lock_file=tmp_path / ".scribe_test.lock")
+    assert result == expected
+
+
 def main():
     """Run all test scenarios."""
     print("="*70)
     print("Build Timestamp & Version Checking Test Suite")
     print("="*70)
     
-    # Test scenarios
-    scenarios = [
-        # (name, current_v, current_build, new_v, new_build, should_acquire)
-        ("Newer version (any build)", "2.0.0", 1000, "2.0.1", 1000, True),
-        ("Older version (any build)", "2.0.1", 1000, "2.0.0", 1000, False),
-        ("Same version, newer build", "2.0.1", 1000, "2.0.1", 2000, True),
-        ("Same version, older build", "2.0.1", 2000, "2.0.1", 1000, False),
-        ("Same version and build", "2.0.1", 1000, "2.0.1", 1000, False),
-    ]
-    
     results = []
-    for scenario in scenarios:
-        result = test_scenario(*scenario)
+    for scenario in SCENARIOS:
+        result = run_scenario(*scenario)
         results.append((scenario[0], result, scenario[5]))
     
     # Summary
-    print(f"\n{'='*70}")
-    print("Test Summary")
-    print(f"{'='*70}")
+    out = [f"\n{'='*70}", "Test Summary", f"{'='*70}"]
     
     passed = sum(1 for _, result, expected in results if result == expected)
     total = len(results)
     
     for name, result, expected in results:
         status = "✅ PASS" if result == expected else "❌ FAIL"
-        print(f"{status} - {name}")
+        out.append(f"{status} - {name}")
     
-    print(f"\n{passed}/{total} tests passed")
+    out.append(f"\n{passed}/{total} tests passed")
+    out.append("\n🎉 All tests passed!" if passed == total else "\n⚠️  Some tests failed")
+    sys.stdout.write("\n".join(out) + "\n")
     
-    if passed == total:
-        print("\n🎉 All tests passed!")
-        return 0
-    else:
-        print("\n⚠️  Some tests failed")
-        return 1
+    return 0 if passed == total else 1
 
 
 if __name__ == "__main__":
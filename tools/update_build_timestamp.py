@@ -11,11 +11,18 @@ Usage:
     python tools/update_build_timestamp.py
 """
 
+import os
+import re
 import sys
+import tempfile
 import time
 from pathlib import Path
 from datetime import datetime
 
+# Whole BUILD_TIMESTAMP line (any old comment is replaced), and the quoted version
+_TS_RE = re.compile(r'^[ \t]*BUILD_TIMESTAMP\s*=.*$', re.M)
+_VER_RE = re.compile(r'^[ \t]*__version__\s*=\s*["\']([^"\']+)', re.M)
+
 
 def update_build_timestamp():
     """Update BUILD_TIMESTAMP in __version__.py to current time."""
@@ -35,35 +42,31 @@ def update_build_timestamp():
     new_timestamp = int(time.time())
     timestamp_str = datetime.fromtimestamp(new_timestamp).strftime("%Y-%m-%d %H:%M:%S")
     
-    # Find and replace BUILD_TIMESTAMP line
-    lines = content.split('\n')
-    updated = False
-    
-    for i, line in enumerate(lines):
-        if line.strip().startswith('BUILD_TIMESTAMP ='):
-            # Keep any comment on the line
-            comment = ""
-            if '#' in line:
-                comment = " " + line.split('#', 1)[1]
-            
-            lines[i] = f"BUILD_TIMESTAMP = {new_timestamp}  # {timestamp_str}"
-            updated = True
-            break
+    # Replace the first BUILD_TIMESTAMP line in a single pass
+    new_content, replaced = _TS_RE.subn(
+        f"BUILD_TIMESTAMP = {new_timestamp}  # {timestamp_str}", content, count=1
+    )
     
-    if not updated:
+    if not replaced:
         print("❌ Error: BUILD_TIMESTAMP not found in __version__.py")
         sys.exit(1)
     
-    # Write updated content
-    new_content = '\n'.join(lines)
-    version_file.write_text(new_content, encoding='utf-8')
+    # Write updated content via a sibling temp file and an atomic rename, so
+    # readers (other CI jobs, IDE watchers) never see a half-written file
+    tf = tempfile.NamedTemporaryFile('w', delete=False, dir=version_file.parent, encoding='utf-8',
+                                     prefix='.__version__.', suffix='.tmp')
+    try:
+        with tf:
+            tf.write(new_content)
+        os.chmod(tf.name, version_file.stat().st_mode)  # Temp files start out 0600
+        os.replace(tf.name, version_file)
+    except BaseException:
+        os.unlink(tf.name)
+        raise
     
     # Show current version info
-    version = None
-    for line in lines:
-        if line.strip().startswith('__version__ ='):
-            version = line.split('=')[1].strip().strip('"\'')
-            break
+    match = _VER_RE.search(new_content)
+    version = match.group(1) if match else None
     
     print(f"✅ Build timestamp updated!")
     print(f"   Version: {version}")
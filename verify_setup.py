@@ -1,5 +1,6 @@
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -11,30 +12,48 @@ print("="*60)
 # Check Python
 print(f"\nPython: {sys.version}")
 
-# Check PyTorch
-try:
-    import torch
-    print(f"PyTorch: {torch.__version__}")
-    print(f"CUDA Available: {torch.cuda.is_available()}")
-    if torch.cuda.is_available():
-        print(f"GPU: {torch.cuda.get_device_name(0)}")
-        print(f"GPU Memory: {torch.cuda.get_device_properties(0).total_memory / (1024**3):.1f} GB")
-except ImportError as e:
-    print(f"PyTorch: NOT INSTALLED - {e}")
-
-# Check faster-whisper
-try:
-    from faster_whisper import WhisperModel
-    print(f"faster-whisper: OK")
-except ImportError as e:
-    print(f"faster-whisper: NOT INSTALLED - {e}")
+def torch_probe():
+    """Import PyTorch and query CUDA once."""
+    try:
+        import torch
+    except ImportError as e:
+        return [f"PyTorch: NOT INSTALLED - {e}"]
+    cuda_available = torch.cuda.is_available()
+    lines = [f"PyTorch: {torch.__version__}", f"CUDA Available: {cuda_available}"]
+    if not cuda_available:
+        return lines
+    # One driver round-trip for both name and memory
+    props = torch.cuda.get_device_properties(0)
+    lines.append(f"GPU: {props.name}")
+    lines.append(f"GPU Memory: {props.total_memory / (1024**3):.1f} GB")
+    return lines
 
-# Check Scribe modules
-try:
-    from scribe.core.transcription_engine import TranscriptionEngine
-    print(f"Scribe core: OK")
-except ImportError as e:
-    print(f"Scribe core: {e}")
+
+def fw_probe():
+    """Check faster-whisper imports."""
+    try:
+        from faster_whisper import WhisperModel
+        return ["faster-whisper: OK"]
+    except ImportError as e:
+        return [f"faster-whisper: NOT INSTALLED - {e}"]
+
+
+def scribe_probe():
+    """Check Scribe core modules import."""
+    try:
+        from scribe.core.transcription_engine import TranscriptionEngine
+        from scribe.config import AppConfig
+        return ["Scribe core: OK"]
+    except ImportError as e:
+        return [f"Scribe core: {e}"]
+
+
+# The imports are slow and independent; run them side by side and print
+# each section as soon as it is ready.
+with ThreadPoolExecutor(max_workers=3) as pool:
+    probes = [pool.submit(probe) for probe in (torch_probe, fw_probe, scribe_probe)]
+    for future in as_completed(probes):
+        print("\n".join(future.result()))
 
 # Check device detection
 print("\n" + "="*60)
@@ -42,7 +61,8 @@ print("DEVICE DETECTION TEST")
 print("="*60)
 
 try:
-    from scribe.config.app_config import AppConfig
+    from scribe.core.transcription_engine import TranscriptionEngine
+    from scribe.config import AppConfig
     config = AppConfig()
     engine = TranscriptionEngine(config)
     device, compute = engine._detect_best_device()
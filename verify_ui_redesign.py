@@ -6,22 +6,20 @@ This script launches the modernized pages individually for visual inspection.
 import sys
 import os
 from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget, QVBoxLayout, QWidget
-from qfluentwidgets import setTheme, Theme, setThemeColor
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from scribe.ui_fluent.pages.home import HomePage
-from scribe.ui_fluent.pages.transcription import TranscriptionPage
-from scribe.ui_fluent.pages.settings import SettingsPage
-from scribe.ui_fluent.pages.insights import InsightsPage
-from scribe.ui_fluent.pages.plugins import PluginsPage
-from scribe.config import ConfigManager
-from scribe.analytics.value_calculator import ValueCalculator
 
 class VerificationWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        # Deferred so the Fluent theme and Scribe services only load when a
+        # window is actually built
+        from qfluentwidgets import setTheme, Theme, setThemeColor
+        from scribe.config import ConfigManager
+        from scribe.analytics.value_calculator import ValueCalculator
+
         self.setWindowTitle("Scribe UI Redesign Verification")
         self.resize(1200, 800)
         
@@ -38,47 +36,74 @@ class VerificationWindow(QMainWindow):
         self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
         
-        # Tabs for each page
+        # Tabs for each page. Each tab starts as an empty holder; its page is
+        # imported and built the first time the tab is shown.
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
         
-        # 1. Home Page
-        self.home_page = HomePage(self.value_calculator)
-        self.tabs.addTab(self.home_page, "🏠 Home")
-        
-        # 2. Transcription Page
-        self.transcription_page = TranscriptionPage(self.config_manager)
-        self.tabs.addTab(self.transcription_page, "🎤 Transcription")
-        
-        # 3. Settings Page
-        self.settings_page = SettingsPage(self.config_manager)
-        self.tabs.addTab(self.settings_page, "⚙️ Settings")
-        
-        # 4. Insights Page
-        self.insights_page = InsightsPage(self.value_calculator)
-        self.tabs.addTab(self.insights_page, "📊 Insights")
-        
-        # 5. Plugins Page
-        self.plugins_page = PluginsPage(None, self.config_manager)
-        self.tabs.addTab(self.plugins_page, "🧩 Plugins")
+        self._pending_pages = {}
+        for label, build in (
+            ("🏠 Home", self._build_home_page),
+            ("🎤 Transcription", self._build_transcription_page),
+            ("⚙️ Settings", self._build_settings_page),
+            ("📊 Insights", self._build_insights_page),
+            ("🧩 Plugins", self._build_plugins_page),
+        ):
+            holder = QWidget()
+            QVBoxLayout(holder).setContentsMargins(0, 0, 0, 0)
+            self._pending_pages[self.tabs.addTab(holder, label)] = build
         
+        self.tabs.currentChanged.connect(self._ensure_page)
+        self._ensure_page(self.tabs.currentIndex())
+    
+    def _ensure_page(self, index):
+        """Build the page behind a tab the first time it becomes current."""
+        build = self._pending_pages.pop(index, None)
+        if build is not None:
+            self.tabs.widget(index).layout().addWidget(build())
+    
+    # 1. Home Page
+    def _build_home_page(self):
+        from scribe.ui_fluent.pages.home import HomePage
+        self.home_page = HomePage(self.value_calculator)
         # Simulate some data
-        self._simulate_data()
-        
-    def _simulate_data(self):
-        # Update Home stats
         self.home_page.update_stats(
             total_transcriptions=12,
             words_saved=4500,
             time_saved_seconds=6750
         )
-        
-        # Update Transcription metrics
+        return self.home_page
+    
+    # 2. Transcription Page
+    def _build_transcription_page(self):
+        from scribe.ui_fluent.pages.transcription import TranscriptionPage
+        self.transcription_page = TranscriptionPage(self.config_manager)
+        # Simulate some data
         self.transcription_page.update_metrics(
             words=125,
             duration=45.5,
             confidence=0.98
         )
+        return self.transcription_page
+    
+    # 3. Settings Page
+    def _build_settings_page(self):
+        from scribe.ui_fluent.pages.settings import SettingsPage
+        self.settings_page = SettingsPage(self.config_manager)
+        return self.settings_page
+    
+    # 4. Insights Page
+    def _build_insights_page(self):
+        from scribe.ui_fluent.pages.insights import InsightsPage
+        self.insights_page = InsightsPage(self.value_calculator)
+        return self.insights_page
+    
+    # 5. Plugins Page
+    def _build_plugins_page(self):
+        from scribe.ui_fluent.pages.plugins import PluginsPage
+        from scribe.plugins.registry import PluginRegistry
+        self.plugins_page = PluginsPage(PluginRegistry())
+        return self.plugins_page
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -86,4 +111,4 @@ if __name__ == "__main__":
     window.show()
     print("\n✨ UI Verification Window Launched")
     print("Please inspect each tab to verify the redesign.")
-    sys.exit(app.exec_())
\ No newline at end of file
+    sys.exit(app.exec_())